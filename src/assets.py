@@ -1,7 +1,246 @@
 import pygame
 import numpy as np
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache, partial
 from os import path
-from settings import PLAYER_H, TILE, WIDTH, HEIGHT
+from settings import PLAYER_H, TILE, WIDTH, HEIGHT, ASSET_MEMORY_BUDGET, BACKGROUND_CACHE_SIZE, TEXT_CACHE_BUDGET
+
+# ----------------- Registro de assets -----------------
+def _nbytes(value):
+    """Memória aproximada de surfaces (também dentro de listas/tuplas/dicts)."""
+    if isinstance(value, pygame.Surface):
+        return value.get_pitch() * value.get_height()
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+class AssetRegistry:
+    """
+    Cache de assets já decodificados/escalados/espelhados, compartilhado por
+    menu, tutorial e jogo. Cada chave é carregada uma vez; acima do orçamento
+    de memória os itens menos usados recentemente são descartados.
+    Quem recebe uma surface daqui não deve alterá-la (use .copy()).
+    """
+    def __init__(self, budget_bytes, use_pack=True):
+        self.budget = budget_bytes
+        self.use_pack = use_pack  # consulta o assets.pack antes do loader
+        self.used = 0
+        self._entries = OrderedDict()  # chave -> (valor, bytes)
+        # Protege o dict (o carregamento inicial usa várias threads); o loader
+        # em si roda fora do lock para que decodificações diferentes sejam paralelas.
+        self._lock = threading.Lock()
+
+    def get(self, key, loader, nbytes=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+        pack = _asset_pack() if self.use_pack else None
+        value = pack.get(key) if pack is not None else None
+        if value is None:
+            value = loader()
+        size = _nbytes(value) if nbytes is None else nbytes
+        with self._lock:
+            if key in self._entries:  # outra thread carregou primeiro
+                return self._entries[key][0]
+            self._entries[key] = (value, size)
+            self.used += size
+            # Descarta os mais antigos, mas nunca o que acabou de entrar
+            while self.used > self.budget and len(self._entries) > 1:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self.used -= old_size
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.used = 0
+
+ASSETS = AssetRegistry(ASSET_MEMORY_BUDGET)
+
+# Fundos de fase têm registro próprio: são grandes e só um aparece por vez,
+# então não devem expulsar sprites do registro principal.
+BACKGROUNDS = AssetRegistry(BACKGROUND_CACHE_SIZE * WIDTH * HEIGHT * 4)
+
+# Textos renderizados: a chave leva o próprio objeto Font, então não passa pelo pacote
+TEXT = AssetRegistry(TEXT_CACHE_BUDGET, use_pack=False)
+
+def render_text(font, text, antialias, color, background=None):
+    """
+    font.render com cache LRU por (fonte, texto, antialias, cor, fundo):
+    textos repetidos frame a frame (HUD, menus) são rasterizados uma vez.
+    A surface é compartilhada: não altere (use .copy() antes de set_alpha).
+    """
+    key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+    return TEXT.get(key, lambda: font.render(text, antialias, color, background))
+
+# ----------------- Pacote de assets pré-processados -----------------
+# Gerado offline (python src/assets.py): todas as surfaces finais do registro
+# (fatiadas, escaladas, espelhadas) em RGBA cru + índice JSON. Em runtime o
+# arquivo é mapeado com mmap e cada surface é criada com image.frombuffer
+# sobre o mapeamento e convertida para o formato da tela, sem decodificar PNG
+# nem reescalar.
+#   cabeçalho: magic, versão, tamanho do índice
+#   índice:    JSON {"meta": {...}, "entries": {chave: estrutura}}
+#   dados:     pixels RGBA (RGBX nas opacas), alinhados em 8 bytes (offsets do índice contam daqui)
+ASSET_PACK_NAME = "assets.pack"
+_APACK_MAGIC = b"DWAP"
+_APACK_VERSION = 2
+_APACK_HEADER = struct.Struct("<4sII")
+
+def _pack_key(key):
+    return json.dumps(key)
+
+def _pack_meta():
+    # o pacote só vale para as mesmas dimensões de jogo
+    return {"tile": TILE, "player_h": PLAYER_H, "size": [WIDTH, HEIGHT]}
+
+def _surface_nodes(node):
+    """Todas as entradas [w, h, offset, formato] de uma estrutura do índice."""
+    if node is None:
+        return
+    if "surface" in node:
+        yield node["surface"]
+    else:
+        for child in node["list"] if "list" in node else node["dict"].values():
+            yield from _surface_nodes(child)
+
+class AssetPack:
+    """Pacote de assets mapeado em memória; get(chave) remonta a estrutura de surfaces."""
+    def __init__(self, pack_path):
+        with open(pack_path, "rb") as f:
+            # ACCESS_COPY: páginas privadas, então escrever numa surface não altera o arquivo
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_len = _APACK_HEADER.unpack_from(self._mm, 0)
+        if magic != _APACK_MAGIC or version != _APACK_VERSION:
+            raise ValueError(f"pacote de assets inválido ou de outra versão: {pack_path}")
+        start = _APACK_HEADER.size
+        index = json.loads(bytes(self._mm[start:start + index_len]).decode("utf-8"))
+        self._base = start + index_len
+        if index["meta"] != _pack_meta():
+            raise ValueError("pacote de assets gerado para outro TILE/PLAYER_H/resolução")
+        self._entries = index["entries"]
+        # pacote truncado/corrompido: recusa aqui (volta para os PNGs) em vez de
+        # falhar no frombuffer de alguma surface no meio do carregamento
+        end = len(self._mm) - self._base
+        for node in self._entries.values():
+            for w, h, offset, _ in _surface_nodes(node):
+                if offset < 0 or offset + w * h * 4 > end:
+                    raise ValueError(f"pacote de assets truncado: {pack_path}")
+        self._view = memoryview(self._mm)
+
+    def _decode(self, node):
+        if node is None:
+            return None
+        if "surface" in node:
+            w, h, offset, fmt = node["surface"]
+            offset += self._base
+            raw = pygame.image.frombuffer(self._view[offset:offset + w * h * 4], (w, h), fmt)
+            # frombuffer fica no layout do arquivo; converte uma vez para o formato
+            # da tela, senão cada blit dessa surface passa pela conversão lenta
+            return raw.convert() if fmt == "RGBX" else raw.convert_alpha()
+        if "list" in node:
+            return [self._decode(n) for n in node["list"]]
+        return {k: self._decode(n) for k, n in node["dict"].items()}
+
+    def get(self, key):
+        node = self._entries.get(_pack_key(key))
+        return None if node is None else self._decode(node)
+
+_ASSET_PACK = {"pack": None, "checked": False}
+_ASSET_PACK_LOCK = threading.Lock()
+
+def _asset_pack():
+    """Abre assets/assets.pack na primeira consulta (None se faltar ou estiver velho)."""
+    with _ASSET_PACK_LOCK:
+        if not _ASSET_PACK["checked"]:
+            _ASSET_PACK["pack"] = _open_asset_pack()
+            _ASSET_PACK["checked"] = True
+    return _ASSET_PACK["pack"]
+
+def _open_asset_pack():
+    pack_path = _asset_path(ASSET_PACK_NAME)
+    img_dir = _asset_path("img")
+    try:
+        pack_mtime = os.stat(pack_path).st_mtime_ns
+        for fname in os.listdir(img_dir):
+            if os.stat(path.join(img_dir, fname)).st_mtime_ns > pack_mtime:
+                print("Aviso: assets.pack desatualizado, carregando imagens originais")
+                return None
+        return AssetPack(pack_path)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+def bake_asset_pack(pack_path=None):
+    """
+    Carrega todos os assets pelo caminho normal (sem pacote) e grava as
+    surfaces finais do registro em assets/assets.pack. Requer display ativo.
+    """
+    from level import load_level_textures  # evita import circular
+
+    _ASSET_PACK["pack"], _ASSET_PACK["checked"] = None, True
+    for registry in (ASSETS, BACKGROUNDS):
+        registry.clear()
+        registry.budget = float("inf")  # nada pode ser descartado durante o bake
+    load_player_sprites()
+    load_player_sprites(flipped=True)
+    load_tile_textures()
+    load_backgrounds()
+    load_level_textures()
+    load_image_scaled("Preview_2.jpg", (WIDTH, HEIGHT))
+
+    to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    blobs = []
+    offset = [0]
+
+    def encode(value):
+        if value is None:
+            return None
+        if isinstance(value, pygame.Surface):
+            # Surfaces opacas continuam opacas (blit sem mistura de alpha)
+            fmt = "RGBA" if value.get_flags() & pygame.SRCALPHA else "RGBX"
+            raw = to_bytes(value, fmt)
+            node = {"surface": [value.get_width(), value.get_height(), offset[0], fmt]}
+            raw += b"\0" * (-len(raw) % 8)
+            blobs.append(raw)
+            offset[0] += len(raw)
+            return node
+        if isinstance(value, dict):
+            return {"dict": {k: encode(v) for k, v in value.items()}}
+        return {"list": [encode(v) for v in value]}
+
+    entries = {}
+    for registry in (ASSETS, BACKGROUNDS):
+        for key, (value, _) in registry._entries.items():
+            if key[0] == "flipped":  # chaves por id() não sobrevivem entre processos
+                continue
+            entries[_pack_key(key)] = encode(value)
+
+    index = json.dumps({"meta": _pack_meta(), "entries": entries}).encode("utf-8")
+    index += b" " * (-(_APACK_HEADER.size + len(index)) % 8)
+
+    pack_path = pack_path or _asset_path(ASSET_PACK_NAME)
+    tmp = pack_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_APACK_HEADER.pack(_APACK_MAGIC, _APACK_VERSION, len(index)))
+        f.write(index)
+        f.write(b"".join(blobs))
+    os.replace(tmp, pack_path)
+    ASSETS.budget = ASSET_MEMORY_BUDGET
+    BACKGROUNDS.budget = BACKGROUND_CACHE_SIZE * WIDTH * HEIGHT * 4
+    BACKGROUNDS.clear()
+    return pack_path
 
 # ----------------- Utils -----------------
 def _asset_path(*parts):
@@ -33,12 +272,39 @@ def _scale_to_h(frames, target_h):
 def _scale_to_tile(surf):
     return pygame.transform.scale(surf, (TILE, TILE))
 
+def load_image_scaled(name, size):
+    """load_image + scale para `size`, decodificado uma vez por processo (registro)."""
+    return ASSETS.get(("image", name, tuple(size)),
+                      lambda: pygame.transform.scale(load_image(name), size))
+
+def flip_frames(frames):
+    """Frames espelhados na horizontal, gerados uma vez por lista de frames."""
+    originals = tuple(frames)
+    key = ("flipped",) + tuple(id(f) for f in originals)
+    # guarda os originais junto: os ids da chave continuam válidos enquanto ela existir
+    _, flipped = ASSETS.get(
+        key,
+        lambda: (originals, [pygame.transform.flip(f, True, False) for f in originals]),
+        nbytes=_nbytes(originals),
+    )
+    return flipped
+
 # ----------------- Players -----------------
-def load_player_sprites():
+def load_player_sprites(flipped=False):
     """
     Retorna {'red': [frames...], 'blue': [frames...]} dimensionados para PLAYER_H.
     Tenta nomes comuns e faz fallback para um retângulo colorido se não encontrar.
+    flipped=True devolve os mesmos frames espelhados (olhando para a esquerda).
+    Compartilhado via registro: não altere as listas nem as surfaces.
     """
+    if flipped:
+        return ASSETS.get(("player_sprites", "left"), lambda: {
+            color: [pygame.transform.flip(f, True, False) for f in frames]
+            for color, frames in load_player_sprites().items()
+        })
+    return ASSETS.get(("player_sprites",), _load_player_sprites)
+
+def _load_player_sprites():
     result = {}
 
     def _load_try(names, tint=None):
@@ -63,7 +329,13 @@ def load_player_sprites():
 
 # ----------------- Tiles / Textures -----------------
 def load_tile_textures():
-    """Carrega e escala texturas de tiles para TILE. Chaves combinam com as regras do level."""
+    """
+    Carrega e escala texturas de tiles para TILE. Chaves combinam com as regras do level.
+    Compartilhado via registro: não altere o dict nem as surfaces.
+    """
+    return ASSETS.get(("tile_textures",), _load_tile_textures)
+
+def _load_tile_textures():
     names = [
         "fechado.png",
         "fechado_cima.png",
@@ -93,179 +365,310 @@ def load_tile_textures():
     return tex
 
 # ----------------- Backgrounds -----------------
+def load_background(level):
+    """
+    faseN.png redimensionado para a janela, ou None se não existir.
+    O fundo cobre a tela inteira, então é convertido para o formato opaco do
+    display (blit sem alpha, 4 bytes/pixel sem canal extra a misturar).
+    Carregado sob demanda e mantido no registro BACKGROUNDS (LRU pequeno).
+    """
+    fname = f"fase{level}.png"
+    try:
+        return BACKGROUNDS.get(
+            ("background", level),
+            lambda: pygame.transform.scale(
+                pygame.image.load(_asset_path("img", fname)), (WIDTH, HEIGHT)
+            ).convert(),
+        )
+    except Exception:
+        return None
+
 def load_backgrounds():
-    """Carrega fase1..fase6.png e redimensiona para a janela. Retorna {nivel:int -> Surface}."""
+    """
+    Carrega fase1..fase6.png e redimensiona para a janela. Retorna {nivel:int -> Surface}.
+    Só para o bake do pacote: o jogo usa load_background(nivel) sob demanda.
+    """
     bgs = {}
     for i in range(1, 7):
-        fname = f"fase{i}.png"
-        try:
-            img = load_image(fname)
-            scaled = pygame.transform.scale(img, (WIDTH, HEIGHT)).convert_alpha()
-            bgs[i] = scaled
-        except Exception:
-            # Se não existir, simplesmente não adiciona
-            continue
+        bg = load_background(i)
+        # Se não existir, simplesmente não adiciona
+        if bg is not None:
+            bgs[i] = bg
     return bgs
 
 # ----------------- Sons -----------------
-def _generate_sweep(start_freq, end_freq, duration, volume=0.3, sample_rate=22050):
-    """Gera um sweep de frequência (chirp)"""
-    n_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, n_samples)
-    freq = np.linspace(start_freq, end_freq, n_samples)
-    wave = np.sin(2 * np.pi * freq * t)
-    envelope = np.ones(n_samples)
-    fade_samples = int(0.05 * sample_rate)
-    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-    wave = wave * envelope * volume * 32767
-    stereo = np.column_stack((wave.astype(np.int16), wave.astype(np.int16)))
-    return pygame.sndarray.make_sound(stereo)
-
-def _generate_jump_sound():
-    """Som de pulo - sweep ascendente curto"""
-    return _generate_sweep(200, 600, 0.15, volume=0.15)
-
-def _generate_land_sound():
-    """Som de pousar - thump curto"""
-    return _generate_sweep(400, 100, 0.08, volume=0.10)
-
-def _generate_death_sound():
-    """Som de morte - sweep descendente"""
-    return _generate_sweep(800, 100, 0.4, volume=0.25)
-
-def _generate_collect_sound():
-    """Som de coleta - arpejo ascendente"""
-    sample_rate = 22050
-    duration = 0.3
-    n_samples = int(duration * sample_rate)
-    frequencies = [523, 659, 784]  # C, E, G
-    wave = np.zeros(n_samples)
-    
-    for i, freq in enumerate(frequencies):
-        start = int(i * n_samples / len(frequencies))
-        end = int((i + 1) * n_samples / len(frequencies))
-        t = np.linspace(0, duration / len(frequencies), end - start)
-        note = np.sin(2 * np.pi * freq * t)
-        wave[start:end] = note
-    
-    envelope = np.exp(-3 * np.linspace(0, 1, n_samples))
-    wave = wave * envelope * 0.2 * 32767
-    stereo = np.column_stack((wave.astype(np.int16), wave.astype(np.int16)))
-    return pygame.sndarray.make_sound(stereo)
-
-def _generate_victory_sound():
-    """Som de vitória - fanfarra alegre"""
-    sample_rate = 22050
-    duration = 1.0
-    n_samples = int(duration * sample_rate)
-    notes = [(523, 0, 0.3), (659, 0.3, 0.6), (784, 0.6, 0.9), (1047, 0.9, 1.0)]
-    
-    wave = np.zeros(n_samples)
-    for freq, start_time, end_time in notes:
-        start_idx = int(start_time * sample_rate)
-        end_idx = int(end_time * sample_rate)
-        t = np.linspace(0, end_time - start_time, end_idx - start_idx)
-        note = np.sin(2 * np.pi * freq * t)
-        note += 0.3 * np.sin(2 * np.pi * freq * 2 * t)
-        wave[start_idx:end_idx] += note
-    
-    envelope = np.exp(-2 * np.linspace(0, 1, n_samples))
-    wave = wave * envelope * 0.35 * 32767
-    stereo = np.column_stack((wave.astype(np.int16), wave.astype(np.int16)))
-    return pygame.sndarray.make_sound(stereo)
-
-def _generate_defeat_sound():
-    """Som de derrota - sweep descendente triste"""
-    sample_rate = 22050
-    duration = 1.5
-    n_samples = int(duration * sample_rate)
-    notes = [(392, 0, 0.3), (349, 0.3, 0.6), (330, 0.6, 0.9), (294, 0.9, 1.2), (262, 1.2, 1.5)]
-    
-    wave = np.zeros(n_samples)
-    for freq, start_time, end_time in notes:
-        start_idx = int(start_time * sample_rate)
-        end_idx = int(end_time * sample_rate)
-        t = np.linspace(0, end_time - start_time, end_idx - start_idx)
-        note = np.sin(2 * np.pi * freq * t)
-        wave[start_idx:end_idx] += note
-    
-    envelope = np.exp(-1.5 * np.linspace(0, 1, n_samples))
-    wave = wave * envelope * 0.3 * 32767
-    stereo = np.column_stack((wave.astype(np.int16), wave.astype(np.int16)))
-    return pygame.sndarray.make_sound(stereo)
-
-def _generate_ambient_music(level_number):
-    """Gera música ambiente baseada no nível"""
-    sample_rate = 22050
-    duration = 4.0
-    n_samples = int(duration * sample_rate)
-    
-    # Escolhe progressão baseada no nível
+# Os geradores devolvem o PCM já no formato do mixer; a Sound é criada em
+# _cached_sound, que guarda o PCM em disco para os próximos runs.
+
+# tamanho informado por mixer.get_init() -> dtype das amostras (negativo = com sinal);
+# o mixer de 32 bits do pygame é sempre float32 e aparece como -32
+_MIXER_DTYPES = {-8: np.int8, 8: np.uint8, -16: np.int16, 16: np.uint16, -32: np.float32, 32: np.float32}
+_DEFAULT_MIXER = (22050, -16, 2)
+
+def mixer_format():
+    """(taxa, tamanho, canais) do mixer aberto (ou o padrão antigo se não houver)."""
+    return pygame.mixer.get_init() or _DEFAULT_MIXER
+
+def mixer_rate():
+    return mixer_format()[0]
+
+def to_pcm(wave):
+    """
+    Onda mono em float (-1..1) -> array no formato real do mixer: mesma taxa
+    (os geradores já sintetizam nela), mesmo tipo de amostra e número de
+    canais. Mono vira array 1-D, sem coluna duplicada.
+    """
+    _, size, channels = mixer_format()
+    dtype = _MIXER_DTYPES.get(size, np.int16)
+    wave = np.clip(wave, -1.0, 1.0)
+    if dtype is np.float32:
+        pcm = wave.astype(np.float32)
+    else:
+        info = np.iinfo(dtype)
+        if info.min < 0:
+            pcm = (wave * info.max).astype(dtype)
+        else:
+            pcm = ((wave + 1.0) * 0.5 * info.max).astype(dtype)
+    if channels == 1:
+        return pcm
+    return np.repeat(pcm[:, None], channels, axis=1)
+
+# ----------------- Núcleo de síntese -----------------
+# Um banco de osciladores vetorizado: todas as vozes de um som são
+# renderizadas numa única operação NumPy (vozes x amostras), com fase
+# contínua por voz. Os sons são só dados (SOUND_PATCHES).
+_DECLICK_SECONDS = 0.003  # rampa nas bordas de cada nota (evita cliques)
+
+def oscillator_bank(f0, f1, length, n_samples, sample_rate, phases=None):
+    """
+    Senoides de várias vozes de uma vez. f0, f1 e length são colunas
+    (vozes, 1): cada voz varre linearmente de f0 a f1 Hz em `length`
+    amostras, a partir da fase inicial `phases` (zero se None).
+    Devolve (senoides float32 (vozes, n_samples), fases após n_samples),
+    para continuar a próxima chamada sem descontinuidade.
+    """
+    # Fase integrada em forma fechada: 2pi/sr * (f0*i + (f1-f0)*i^2 / (2*length))
+    a = (2 * np.pi / sample_rate) * np.asarray(f0, dtype=np.float64)
+    b = (np.pi / sample_rate) * (np.asarray(f1, dtype=np.float64) - f0) / length
+    if phases is None:
+        phases = np.zeros_like(a)
+    else:
+        phases = np.asarray(phases, dtype=np.float64).reshape(a.shape)
+    i = np.arange(n_samples)
+    phase = (a + b * i) * i + phases
+    end = ((a + b * n_samples) * n_samples + phases) % (2 * np.pi)
+    # fase em float64 (sem deriva); o seno em float32 é bem mais rápido
+    return np.sin(phase, dtype=np.float32), end
+
+@lru_cache(maxsize=8)
+def _declick_ramp(n_samples):
+    ramp = np.linspace(0, 1, n_samples, endpoint=False, dtype=np.float32)
+    ramp.flags.writeable = False
+    return ramp
+
+@lru_cache(maxsize=32)
+def envelope_table(kind, n_samples, param, sample_rate):
+    """
+    Envelope global reutilizável (somente leitura):
+      ("fade", n, segundos)  sobe/desce linearmente nas pontas
+      ("exp",  n, taxa)      decaimento exponencial exp(-taxa * t/duração)
+    """
+    if kind == "fade":
+        env = np.ones(n_samples)
+        fade = min(int(param * sample_rate), n_samples)
+        env[:fade] = np.linspace(0, 1, fade)
+        env[n_samples - fade:] = np.linspace(1, 0, fade)
+    else:
+        env = np.exp(-param * np.linspace(0, 1, n_samples))
+    env.flags.writeable = False
+    return env
+
+def render_patch(patch):
+    """
+    Renderiza um patch {"duration", "volume", "envelope": (tipo, param),
+    "voices": [(freq_ini, freq_fim, t_ini, t_fim, amplitude), ...]} no
+    formato do mixer. A frequência de cada voz varia linearmente entre
+    freq_ini e freq_fim (sweep) dentro do seu intervalo de tempo.
+    """
+    sample_rate = mixer_rate()
+    n_samples = int(patch["duration"] * sample_rate)
+    voices = np.asarray(patch["voices"], dtype=np.float64)
+    f0, f1, amp = voices[:, 0:1], voices[:, 1:2], voices[:, 4:5]
+    start = (voices[:, 2:3] * sample_rate).astype(np.int64)
+    end = np.minimum((voices[:, 3:4] * sample_rate).astype(np.int64), n_samples)
+    length = np.maximum(end - start, 1)
+
+    # Cada voz só é renderizada no seu trecho: matriz (vozes, maior trecho)
+    width = int(length.max())
+    sines, _ = oscillator_bank(f0, f1, length, width, sample_rate)
+    # Rampas curtas nas bordas de cada voz (tabelas reaproveitadas) e
+    # silêncio depois do fim das vozes mais curtas
+    ramp = min(max(1, int(_DECLICK_SECONDS * sample_rate)), int(length.min()) // 2 or 1)
+    up = _declick_ramp(ramp)
+    sines[:, :ramp] *= up
+    tail = np.maximum(length - ramp, 0) + np.arange(ramp)
+    rows = np.arange(len(voices))[:, None]
+    sines[rows, tail] *= up[::-1]
+    i = np.arange(width)
+    sines[i >= length] = 0.0
+    sines *= amp.astype(np.float32)
+
+    # Mistura: soma todos os trechos nas suas posições de uma vez
+    pos = np.minimum(start + i, n_samples - 1)
+    wave = np.bincount(pos.ravel(), weights=sines.ravel(), minlength=n_samples)
+    kind, param = patch["envelope"]
+    wave *= envelope_table(kind, n_samples, param, sample_rate)
+    wave *= patch["volume"]
+    return to_pcm(wave)
+
+def _notes(notes, partials=((1, 1.0),)):
+    """Notas (freq, t_ini, t_fim) -> vozes, com parciais (multiplicador, amplitude)."""
+    return [(f * m, f * m, t0, t1, a) for f, t0, t1 in notes for m, a in partials]
+
+# Os sweeps usam a frequência instantânea dos geradores antigos, que
+# calculavam sin(2pi * f(t) * t) e por isso terminavam em 2*fim - início
+# (valores negativos só invertem a fase): os sons continuam os mesmos.
+SOUND_PATCHES = {
+    # Pulo - sweep ascendente curto
+    'jump': {"duration": 0.15, "volume": 0.15, "envelope": ("fade", 0.05),
+             "voices": [(200, 1000, 0, 0.15, 1.0)]},
+    # Pousar - thump curto
+    'land': {"duration": 0.08, "volume": 0.10, "envelope": ("fade", 0.05),
+             "voices": [(400, -200, 0, 0.08, 1.0)]},
+    # Morte - sweep descendente
+    'death': {"duration": 0.4, "volume": 0.25, "envelope": ("fade", 0.05),
+              "voices": [(800, -600, 0, 0.4, 1.0)]},
+    # Coleta - arpejo ascendente (C, E, G)
+    'collect': {"duration": 0.3, "volume": 0.2, "envelope": ("exp", 3),
+                "voices": _notes([(523, 0, 0.1), (659, 0.1, 0.2), (784, 0.2, 0.3)])},
+    # Vitória - fanfarra alegre, com a oitava a 30%
+    'victory': {"duration": 1.0, "volume": 0.35, "envelope": ("exp", 2),
+                "voices": _notes([(523, 0, 0.3), (659, 0.3, 0.6), (784, 0.6, 0.9), (1047, 0.9, 1.0)],
+                                 partials=((1, 1.0), (2, 0.3)))},
+    # Derrota - descida triste
+    'defeat': {"duration": 1.5, "volume": 0.3, "envelope": ("exp", 1.5),
+               "voices": _notes([(392, 0, 0.3), (349, 0.3, 0.6), (330, 0.6, 0.9),
+                                 (294, 0.9, 1.2), (262, 1.2, 1.5)])},
+}
+
+# Progressões de acordes da música ambiente (tocadas pelo MusicStream em music.py)
+AMBIENT_PROGRESSIONS = {
+    "calma": [
+        (220, 262, 330),  # Am
+        (175, 220, 262),  # F
+        (131, 165, 196),  # C
+        (196, 247, 294),  # G
+    ],
+    "alegre": [
+        (262, 330, 392),  # C
+        (196, 247, 294),  # G
+        (220, 262, 330),  # Am
+        (175, 220, 262),  # F
+    ],
+    "tensa": [
+        (147, 175, 220),  # Dm
+        (117, 147, 175),  # Bb
+        (98, 117, 147),   # Gm
+        (110, 139, 165),  # A
+    ],
+}
+
+def ambient_progression(level_number):
+    """Progressão de acordes da música ambiente, escolhida pelo nível."""
     if level_number <= 2:
-        chord_progression = [
-            [(220, 262, 330), 0, 1],  # Am
-            [(175, 220, 262), 1, 2],  # F
-            [(131, 165, 196), 2, 3],  # C
-            [(196, 247, 294), 3, 4],  # G
-        ]
+        return AMBIENT_PROGRESSIONS["calma"]
     elif level_number <= 4:
-        chord_progression = [
-            [(262, 330, 392), 0, 1],  # C
-            [(196, 247, 294), 1, 2],  # G
-            [(220, 262, 330), 2, 3],  # Am
-            [(175, 220, 262), 3, 4],  # F
-        ]
-    else:
-        chord_progression = [
-            [(147, 175, 220), 0, 1],  # Dm
-            [(117, 147, 175), 1, 2],  # Bb
-            [(98, 117, 147), 2, 3],   # Gm
-            [(110, 139, 165), 3, 4],  # A
-        ]
-    
-    wave = np.zeros(n_samples)
-    
-    for chord, start_time, end_time in chord_progression:
-        start_idx = int(start_time * sample_rate)
-        end_idx = int(end_time * sample_rate)
-        t = np.linspace(0, end_time - start_time, end_idx - start_idx)
-        
-        chord_wave = np.zeros(end_idx - start_idx)
-        for freq in chord:
-            chord_wave += np.sin(2 * np.pi * freq * t)
-        
-        local_envelope = np.ones(end_idx - start_idx)
-        fade = int(0.1 * sample_rate)
-        local_envelope[:fade] = np.linspace(0, 1, fade)
-        local_envelope[-fade:] = np.linspace(1, 0, fade)
-        
-        wave[start_idx:end_idx] += chord_wave * local_envelope
-    
-    wave = wave / np.max(np.abs(wave))
-    wave = wave * 0.15 * 32767
-    stereo = np.column_stack((wave.astype(np.int16), wave.astype(np.int16)))
-    return pygame.sndarray.make_sound(stereo)
-
-def load_sounds():
-    """Carrega/gera todos os sons do jogo"""
+        return AMBIENT_PROGRESSIONS["alegre"]
+    return AMBIENT_PROGRESSIONS["tensa"]
+
+# ----------------- Cache de áudio em disco -----------------
+# O PCM sintetizado é determinístico: fica em assets/sound_cache/*.npy e nos
+# próximos runs é só mapeado (np.load com mmap) em vez de sintetizado.
+# O nome leva um hash do código do gerador (e das funções que ele chama),
+# dos argumentos (o patch) e do formato do mixer; qualquer mudança gera outro arquivo.
+SOUND_CACHE_DIR = "sound_cache"
+_SOUND_CACHE_VERSION = 2
+
+def _code_fingerprint(code, h, seen):
+    if code in seen:
+        return
+    seen.add(code)
+    h.update(code.co_code)
+    # lambdas/comprehensions são code objects aninhados, cujo repr traz o
+    # endereço de memória: entram pelo conteúdo, nunca pelo repr
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_fingerprint(const, h, seen)
+        else:
+            h.update(repr(const).encode("utf-8"))
+    # segue os helpers do módulo chamados pelo gerador (ex.: oscillator_bank)
+    for name in code.co_names:
+        helper = globals().get(name)
+        helper = getattr(helper, "__wrapped__", helper)  # lru_cache
+        if callable(helper) and hasattr(helper, "__code__"):
+            _code_fingerprint(helper.__code__, h, seen)
+
+def _sound_cache_key(generator, args):
+    h = hashlib.sha1()
+    h.update(repr((_SOUND_CACHE_VERSION, args, pygame.mixer.get_init())).encode("utf-8"))
+    _code_fingerprint(generator.__code__, h, set())
+    return h.hexdigest()[:16]
+
+def _cached_sound(stem, generator, *args):
+    """Sound de generator(*args); o PCM vem do cache em disco quando existe."""
+    cache_dir = _asset_path(SOUND_CACHE_DIR)
+    cache_file = path.join(cache_dir, f"{stem}-{_sound_cache_key(generator, args)}.npy")
     try:
-        sounds = {
-            'jump': _generate_jump_sound(),
-            'land': _generate_land_sound(),
-            'death': _generate_death_sound(),
-            'collect': _generate_collect_sound(),
-            'victory': _generate_victory_sound(),
-            'defeat': _generate_defeat_sound(),
-        }
-        
-        # Música ambiente por nível
-        sounds['music'] = {}
-        for level in range(1, 7):
-            sounds['music'][level] = _generate_ambient_music(level)
-        
-        print("✓ Sons carregados com sucesso!")
-        return sounds
-    except Exception as e:
-        print(f"Aviso: Não foi possível carregar sons: {e}")
-        return {}
+        pcm = np.load(cache_file, mmap_mode="r")
+    except (OSError, ValueError):
+        pcm = generator(*args)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # remove versões antigas do mesmo som antes de gravar a nova
+            for old in os.listdir(cache_dir):
+                if old.startswith(stem + "-") and old.count("-") == stem.count("-") + 1:
+                    os.remove(path.join(cache_dir, old))
+            tmp = cache_file + ".tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, pcm)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # sem cache (ex.: pasta somente leitura), só sintetiza
+    return pygame.sndarray.make_sound(pcm)
+
+def sound_jobs():
+    """Um job independente por efeito sonoro: {"sfx:nome": função}."""
+    return {f"sfx:{name}": partial(_cached_sound, name, render_patch, patch)
+            for name, patch in SOUND_PATCHES.items()}
+
+def sounds_from_results(results):
+    """Monta o dict de sons a partir dos resultados de sound_jobs()."""
+    return {name: results[f"sfx:{name}"] for name in SOUND_PATCHES}
+
+# ----------------- Carregamento paralelo -----------------
+def load_parallel(jobs, on_progress=None, max_workers=None):
+    """
+    Roda os jobs independentes {nome: função} num pool de threads e devolve
+    {nome: resultado | exceção}. Decodificação de imagem, scale e NumPy
+    liberam o GIL, então os jobs realmente se sobrepõem. on_progress(feitos,
+    total) é chamado na thread principal enquanto espera (tela de loading).
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets") as pool:
+        futures = {pool.submit(job): name for name, job in jobs.items()}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=1 / 30, return_when=FIRST_COMPLETED)
+            for f in done:
+                exc = f.exception()
+                results[futures[f]] = exc if exc is not None else f.result()
+            if on_progress is not None:
+                on_progress(len(results), len(jobs))
+    return results
+
+if __name__ == "__main__":
+    # Gera assets/assets.pack (rodar de novo sempre que mudar alguma imagem)
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    print("Pacote gerado:", bake_asset_pack())
+    pygame.quit()
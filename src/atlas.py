@@ -0,0 +1,78 @@
+import pygame
+
+class TextureAtlas:
+    """
+    Junta várias surfaces pequenas (tiles, portais, meteoros, dinos) em
+    poucas folhas grandes, empacotadas em prateleiras. lookup(surface) devolve
+    (folha, área) para desenhar a mesma imagem a partir da folha, o que
+    permite mandar um grupo inteiro num único Surface.blits.
+    """
+    def __init__(self, surfaces, sheet_size=1024, padding=1):
+        self.sheet_size = sheet_size
+        self.padding = padding
+        self.sheets = []
+        self._regions = {}   # id(surface) -> (folha, Rect)
+        self._sources = []   # mantém as originais vivas (ids estáveis)
+
+        unique = {}
+        for s in surfaces:
+            if s is None or id(s) in unique:
+                continue
+            # Só alpha por pixel "puro": alpha de surface/colorkey mudariam o blit
+            if not s.get_flags() & pygame.SRCALPHA or s.get_alpha() not in (None, 255) or s.get_colorkey():
+                continue
+            w, h = s.get_size()
+            if w + padding <= sheet_size and h + padding <= sheet_size:
+                unique[id(s)] = s
+        # Mais altas primeiro: prateleiras mais cheias
+        ordered = sorted(unique.values(), key=lambda s: (s.get_height(), s.get_width()), reverse=True)
+
+        sheet = None
+        x = y = shelf_h = 0
+        for s in ordered:
+            w, h = s.get_size()
+            if sheet is not None and x + w > sheet_size:
+                x, y, shelf_h = 0, y + shelf_h + padding, 0
+            if sheet is None or y + h > sheet_size:
+                sheet = pygame.Surface((sheet_size, sheet_size), pygame.SRCALPHA)
+                self.sheets.append(sheet)
+                x = y = shelf_h = 0
+            # MAX sobre fundo zerado copia RGBA exato (blit normal pré-multiplicaria o alpha)
+            sheet.blit(s, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            self._regions[id(s)] = (sheet, pygame.Rect(x, y, w, h))
+            self._sources.append(s)
+            x += w + padding
+            shelf_h = max(shelf_h, h)
+
+    def lookup(self, surface):
+        """(folha, área) da surface no atlas, ou None se ela não foi incluída."""
+        return self._regions.get(id(surface))
+
+    def __contains__(self, surface):
+        return id(surface) in self._regions
+
+
+class AtlasGroup(pygame.sprite.Group):
+    """
+    Group cujo draw monta uma lista (folha, destino, área) e desenha tudo
+    com um único Surface.blits. Imagens fora do atlas (cópias com alpha,
+    fallbacks coloridos) entram na mesma chamada como blit direto.
+    """
+    def __init__(self, atlas, *sprites):
+        self.atlas = atlas
+        super().__init__(*sprites)
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        sprites = self.sprites()
+        batch = []
+        for spr in sprites:
+            region = self.atlas.lookup(spr.image) if self.atlas is not None else None
+            if region is None:
+                batch.append((spr.image, spr.rect, None, special_flags))
+            else:
+                sheet, area = region
+                batch.append((sheet, spr.rect, area, special_flags))
+        # Como Group.draw: guarda os retângulos desenhados para Group.clear()
+        self.spritedict.update(zip(sprites, surface.blits(batch)))
+        self.lostsprites = []
+        return self.lostsprites
@@ -1,10 +1,19 @@
 import pygame
 from os import path
+from concurrent.futures import ThreadPoolExecutor
 
 from settings import TITULO, WIDTH, HEIGHT, FPS, LEVEL_TIMES, DEFAULT_LEVEL_TIME, TIMER_OK, TIMER_WARN, TIMER_DANG, BG, LEVEL_NAMES
-from assets import load_player_sprites, load_sounds, load_backgrounds
+from settings import MUSIC_CHANNEL, DIRTY_RECTS, TITLE_PULSE_STEPS
+from assets import (
+    load_player_sprites, load_background, load_parallel, sound_jobs, sounds_from_results, render_text
+)
 from sprites import Player
-from level import load_level, build_level_surface
+from level import load_level, load_level_textures, build_level_surface
+from spatial import SpatialGroup, RampGroup
+from atlas import TextureAtlas, AtlasGroup
+from music import MusicStream
+from sfx import VoiceManager
+from levelmap import open_level_pack, load_compiled_level
 from menu import show_menu
 from tutorial import show_tutorial
 
@@ -22,15 +31,35 @@ class Game:
         self.level_complete_timer = 0
         self.level_complete_delay = 1.0  # atraso antes de avançar de fase
 
-        # Assets
-        self.player_frames = load_player_sprites()
-        self.sounds = load_sounds()
-        self.backgrounds = load_backgrounds()   # <<< fundos por fase
+        # Pacote de níveis compilados (levels/levels.pack, gerado por levelmap.py).
+        # Se não existir ou estiver desatualizado, cada fase vem do seu .txt/cache.
+        self.levels_dir = path.abspath(path.join(path.dirname(__file__), "..", "levels"))
+        self.level_pack = open_level_pack(self.levels_dir, range(1, self.total_levels + 1))
+
+        # Níveis compilados numa thread de fundo: {nível: Future}. O próximo nível
+        # é preparado enquanto o atual é jogado; só os sprites são montados aqui.
+        self.level_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-preload")
+        self.compiled_levels = {}
+        # Fundos pré-carregados na mesma thread: {nível: Future}, consumidos ao entrar na fase
+        self.background_requests = {}
+
+        # Assets: carregados em paralelo com tela de progresso
+        self._load_startup_assets()
+
+        # Atlas com tudo que é desenhado por sprite: os grupos desenham num só blits()
+        self.atlas = TextureAtlas(self._atlas_surfaces())
 
         # Sistema de áudio
-        self.music_channel = pygame.mixer.Channel(0)  # Canal dedicado para música
+        self.music_channel = pygame.mixer.Channel(MUSIC_CHANNEL)  # Canal dedicado para música
         self.music_volume = 0.15
+        self.music = MusicStream(self.music_channel, self.music_volume)  # síntese em streaming
         self.sfx_volume = 1.0
+        self.sfx = VoiceManager(self.sounds)  # pool de canais dos efeitos
+
+        # Modo de retângulos sujos (opcional): áreas desenhadas no frame anterior
+        self.dirty_rects = DIRTY_RECTS
+        self.prev_rects = []
+        self.full_redraw = True  # próximo frame redesenha/atualiza a tela toda
 
         # Fonte para UI
         self.font = pygame.font.Font(None, 48)
@@ -48,41 +77,75 @@ class Game:
 
     def load_current_level(self):
         """Carrega o nível atual e reseta tudo que é per-fase (inclui timer)."""
-        # Limpa grupos anteriores
-        self.all_tiles = pygame.sprite.Group()
-        self.solids = pygame.sprite.Group()
+        # Limpa grupos anteriores (grupos consultados pelo player são indexados em grade)
+        self.all_tiles = AtlasGroup(self.atlas)
+        self.animated_tiles = AtlasGroup(self.atlas)  # portais: desenhados ao vivo
+        self.solids = SpatialGroup()
+        # Só agrupam (a colisão usa solids com camadas e a grade de tipos): sem índice
         self.color_tiles = pygame.sprite.Group()
         self.hazards = pygame.sprite.Group()
-        self.doors = pygame.sprite.Group()
-        self.ramps = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.doors = SpatialGroup()
+        self.ramps = RampGroup()
+        self.enemies = AtlasGroup(self.atlas)
 
-        # Caminho do nível
+        # Caminho do nível (dados compilados já devem estar prontos pela pré-carga)
         level_filename = f"level{self.current_level}.txt"
-        level_path = path.abspath(path.join(path.dirname(__file__), "..", "levels", level_filename))
+        level_path = path.join(self.levels_dir, level_filename)
+        level_data = self.request_level(self.current_level).result()
 
-        # Carrega mapa para grupos, recebe posições de spawn
-        spawns = load_level(level_path, {
+        # Carrega mapa para grupos, recebe posições de spawn e a grade de tipos
+        spawns, self.tile_kinds = load_level(level_path, {
             "all_tiles": self.all_tiles,
+            "animated": self.animated_tiles,
             "solids": self.solids,
             "color_tiles": self.color_tiles,
             "hazards": self.hazards,
             "doors": self.doors,
             "ramps": self.ramps,
             "enemies": self.enemies,
-        })
-
-        # Cria surface do nível (apenas tiles/objetos, transparente)
-        self.level_surface = build_level_surface(self.all_tiles)
-
-        # Fundo da fase atual (pode faltar)
-        self.current_background = self.backgrounds.get(self.current_level)
+        }, data=level_data, textures=self.level_textures)
+
+        # Fundo da fase atual (pode faltar); normalmente já veio na pré-carga
+        future = self.background_requests.pop(self.current_level, None)
+        self.current_background = future.result() if future else load_background(self.current_level)
+
+        # Já começa a preparar a próxima fase em segundo plano
+        if self.current_level < self.total_levels:
+            self.request_level(self.current_level + 1)
+            self.request_background(self.current_level + 1)
+
+        # Camada estática opaca: fundo + tiles fixos (portais/inimigos/jogadores vão por cima)
+        self.level_surface = build_level_surface(self.all_tiles, self.current_background)
+
+        # Snapshot do estado inicial: reinícios da mesma fase só resetam estado
+        self.level_template = {"level": self.current_level, "spawns": spawns}
+
+        self._start_level(spawns)
+
+    def restart_level(self):
+        """
+        Reinicia a fase atual a partir do snapshot tirado em load_current_level:
+        grupos, índices e surfaces são reaproveitados; só inimigos, jogadores,
+        timer e música voltam ao estado inicial. Se o snapshot for de outra
+        fase, carrega normalmente.
+        """
+        template = getattr(self, "level_template", None)
+        if template is None or template["level"] != self.current_level:
+            self.load_current_level()
+            return
+        for enemy in self.enemies:
+            enemy.reset()
+        self._start_level(template["spawns"])
 
+    def _start_level(self, spawns):
+        """Reseta o estado por fase (jogadores, timers, pausa) e inicia a música."""
         # Cria ou reposiciona jogadores
         if not hasattr(self, 'p1'):
-            self.p1 = Player(spawns["red"][0], spawns["red"][1], "red", self.player_frames["red"], self.sounds)
-            self.p2 = Player(spawns["blue"][0], spawns["blue"][1], "blue", self.player_frames["blue"], self.sounds)
-            self.players = pygame.sprite.Group(self.p1, self.p2)
+            self.p1 = Player(spawns["red"][0], spawns["red"][1], "red", self.player_frames["red"], self.sfx,
+                             frames_left=self.player_frames_left["red"])
+            self.p2 = Player(spawns["blue"][0], spawns["blue"][1], "blue", self.player_frames["blue"], self.sfx,
+                             frames_left=self.player_frames_left["blue"])
+            self.players = AtlasGroup(self.atlas, self.p1, self.p2)
         else:
             # Reposiciona jogadores existentes
             self.p1.rect.midbottom = spawns["red"]
@@ -104,10 +167,85 @@ class Game:
         # Pause state
         self.paused = False
         self.pause_ticks = 0
+        self.full_redraw = True
         
         # Inicia música do nível
         self.play_level_music()
 
+    def _load_startup_assets(self):
+        """
+        Decodifica/escala imagens e sintetiza os sons num pool de threads,
+        desenhando uma barra de progresso enquanto espera.
+        """
+        jobs = {
+            "players": lambda: (load_player_sprites(), load_player_sprites(flipped=True)),
+            "level_textures": load_level_textures,  # tiles/portais/meteoros, uma vez só
+        }
+        jobs.update(sound_jobs())
+
+        loading_font = pygame.font.Font(None, 48)
+
+        def draw_progress(done, total):
+            pygame.event.pump()  # mantém a janela responsiva
+            self.screen.fill(BG)
+            text = render_text(loading_font, "Carregando...", True, (230, 230, 230))
+            self.screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40)))
+            bar = pygame.Rect(0, 0, WIDTH // 2, 24)
+            bar.center = (WIDTH // 2, HEIGHT // 2 + 20)
+            pygame.draw.rect(self.screen, (60, 65, 80), bar, border_radius=8)
+            fill = bar.copy()
+            fill.width = int(bar.width * done / max(1, total))
+            if fill.width > 0:
+                pygame.draw.rect(self.screen, (100, 200, 255), fill, border_radius=8)
+            pygame.display.flip()
+
+        draw_progress(0, len(jobs))
+        results = load_parallel(jobs, draw_progress)
+
+        # Erros de imagem já viram fallback dentro dos loaders; aqui só repassa
+        for name in ("players", "level_textures"):
+            if isinstance(results[name], Exception):
+                raise results[name]
+        self.player_frames, self.player_frames_left = results["players"]
+        self.level_textures = results["level_textures"]
+
+        errors = [r for r in results.values() if isinstance(r, Exception)]
+        if errors:
+            print(f"Aviso: Não foi possível carregar sons: {errors[0]}")
+            self.sounds = {}
+        else:
+            self.sounds = sounds_from_results(results)
+            print("✓ Sons carregados com sucesso!")
+
+    def _atlas_surfaces(self):
+        """Surfaces usadas pelos sprites do jogo (entradas do atlas)."""
+        tex = self.level_textures
+        surfaces = list(tex["tiles"].values())
+        surfaces += tex["portal_red"] or []
+        surfaces += tex["portal_blue"] or []
+        surfaces += list(tex["enemies"].values())
+        for frames in (self.player_frames, self.player_frames_left):
+            for color_frames in frames.values():
+                surfaces += color_frames
+        return surfaces
+
+    def _compile_level(self, number):
+        if self.level_pack is not None and number in self.level_pack:
+            return self.level_pack.get(number)
+        return load_compiled_level(path.join(self.levels_dir, f"level{number}.txt"))
+
+    def request_level(self, number):
+        """Future com o nível compilado; agenda a compilação na thread se ainda não foi."""
+        if number not in self.compiled_levels:
+            self.compiled_levels[number] = self.level_loader.submit(self._compile_level, number)
+        return self.compiled_levels[number]
+
+    def request_background(self, number):
+        """Agenda o carregamento do fundo da fase na thread de pré-carga."""
+        if number not in self.background_requests:
+            self.background_requests[number] = self.level_loader.submit(load_background, number)
+        return self.background_requests[number]
+
     def show_victory_screen(self):
         """Mostra tela de vitória melhorada com animações"""
         import math
@@ -115,6 +253,7 @@ class Game:
         
         victory = True
         anim_time = 0.0
+        scene = self._victory_scene()
         
         # Cria estrelas/partículas de celebração
         particles = []
@@ -148,16 +287,11 @@ class Game:
                     elif event.key == pygame.K_RETURN:
                         # Reinicia do nível 1
                         self.current_level = 1
-                        self.load_current_level()
+                        self.restart_level()
                         victory = False
 
-            # Background gradiente
-            for y in range(HEIGHT):
-                ratio = y / HEIGHT
-                r = int(20 + (50 - 20) * ratio)
-                g = int(20 + (30 - 20) * ratio)
-                b = int(60 + (80 - 60) * ratio)
-                pygame.draw.line(self.screen, (r, g, b), (0, y), (WIDTH, y))
+            # Fundo gradiente (pré-renderizado)
+            self.screen.blit(scene["gradient"], (0, 0))
             
             # Atualiza e desenha partículas
             for particle in particles:
@@ -171,96 +305,116 @@ class Game:
                                  (int(particle['x']), int(particle['y'])), 
                                  particle['size'])
             
-            # Painel central
-            panel_w, panel_h = 700, 400
-            panel_x = (WIDTH - panel_w) // 2
-            panel_y = (HEIGHT - panel_h) // 2
+            # Painel com sombra, linha e textos fixos (pré-renderizado)
+            panel_x, panel_y = scene["panel_pos"]
+            shadow, body, labels = scene["panel"]
+            self.screen.blit(shadow, (panel_x + 5, panel_y + 5))
+            self.screen.blit(body, (panel_x, panel_y))
             
-            # Sombra do painel
-            shadow_surf = pygame.Surface((panel_w + 10, panel_h + 10), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surf, (0, 0, 0, 100), (0, 0, panel_w + 10, panel_h + 10), border_radius=20)
-            self.screen.blit(shadow_surf, (panel_x + 5, panel_y + 5))
+            # Título com efeito pulsante: escalas pré-calculadas
+            pulse_step = round((math.sin(anim_time * 3) + 1) / 2 * (len(scene["titles"]) - 1))
+            title_shadow, title = scene["titles"][pulse_step]
+            self.screen.blit(title_shadow, title_shadow.get_rect(center=(WIDTH // 2 + 3, panel_y + 80 + 3)))
+            self.screen.blit(title, title.get_rect(center=(WIDTH // 2, panel_y + 80)))
             
-            # Painel principal
-            panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surf, (40, 40, 70, 230), (0, 0, panel_w, panel_h), border_radius=20)
-            pygame.draw.rect(panel_surf, (255, 215, 0), (0, 0, panel_w, panel_h), 5, border_radius=20)
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-            
-            # Título com efeito pulsante
-            pulse = 1.0 + 0.1 * math.sin(anim_time * 3)
-            title_font = pygame.font.Font(None, 100)
-            title_text = "🏆 VITÓRIA! 🏆"
-            
-            # Sombra do título
-            title_shadow = title_font.render(title_text, True, (0, 0, 0))
-            title_shadow_scaled = pygame.transform.scale(
-                title_shadow, 
-                (int(title_shadow.get_width() * pulse), int(title_shadow.get_height() * pulse))
-            )
-            shadow_rect = title_shadow_scaled.get_rect(center=(WIDTH // 2 + 3, panel_y + 80 + 3))
-            self.screen.blit(title_shadow_scaled, shadow_rect)
-            
-            # Título principal
-            title = title_font.render(title_text, True, (255, 215, 0))
-            title_scaled = pygame.transform.scale(
-                title, 
-                (int(title.get_width() * pulse), int(title.get_height() * pulse))
-            )
-            title_rect = title_scaled.get_rect(center=(WIDTH // 2, panel_y + 80))
-            self.screen.blit(title_scaled, title_rect)
-            
-            # Linha decorativa
-            line_y = panel_y + 140
-            pygame.draw.line(self.screen, (255, 215, 0), 
-                           (panel_x + 50, line_y), 
-                           (panel_x + panel_w - 50, line_y), 3)
-            
-            # Mensagem principal
-            msg1 = self.font.render("Parabéns!", True, (255, 255, 255))
-            msg1_rect = msg1.get_rect(center=(WIDTH // 2, panel_y + 180))
-            self.screen.blit(msg1, msg1_rect)
-            
-            msg2 = self.small_font.render("Você completou todos os 6 níveis!", True, (200, 255, 200))
-            msg2_rect = msg2.get_rect(center=(WIDTH // 2, panel_y + 220))
-            self.screen.blit(msg2, msg2_rect)
+            self.screen.blit(labels, (panel_x, panel_y))
             
             # Dinossauros comemorando (animados)
             dino_bounce = abs(math.sin(anim_time * 4)) * 10
-            
-            # Dinossauro vermelho
-            if hasattr(self, 'p1'):
-                dino_red = self.p1.frames_right[int(anim_time * 8) % len(self.p1.frames_right)]
-                dino_red_scaled = pygame.transform.scale(dino_red, (60, 60))
-                self.screen.blit(dino_red_scaled, (panel_x + 80, panel_y + 260 - dino_bounce))
-            
-            # Dinossauro azul
-            if hasattr(self, 'p2'):
-                dino_blue = self.p2.frames_right[int(anim_time * 8) % len(self.p2.frames_right)]
-                dino_blue_scaled = pygame.transform.scale(dino_blue, (60, 60))
-                self.screen.blit(dino_blue_scaled, (panel_x + panel_w - 140, panel_y + 260 - dino_bounce))
-            
-            # Texto "Equipe Perfeita!"
-            team_text = self.small_font.render("🤝 Equipe Perfeita! 🤝", True, (255, 200, 100))
-            team_rect = team_text.get_rect(center=(WIDTH // 2, panel_y + 280))
-            self.screen.blit(team_text, team_rect)
+            frame = int(anim_time * 8)
+            if scene["dino_red"]:
+                dino_red = scene["dino_red"][frame % len(scene["dino_red"])]
+                self.screen.blit(dino_red, (panel_x + 80, panel_y + 260 - dino_bounce))
+            if scene["dino_blue"]:
+                dino_blue = scene["dino_blue"][frame % len(scene["dino_blue"])]
+                self.screen.blit(dino_blue, (panel_x + scene["panel_w"] - 140, panel_y + 260 - dino_bounce))
             
             # Instruções com efeito pulsante
-            inst_alpha = int(200 + 55 * math.sin(anim_time * 4))
-            inst1 = self.small_font.render("ENTER - Jogar Novamente", True, (100, 255, 100))
-            inst1.set_alpha(inst_alpha)
-            inst1_rect = inst1.get_rect(center=(WIDTH // 2, panel_y + 340))
-            self.screen.blit(inst1, inst1_rect)
-            
-            inst2 = self.small_font.render("ESC - Sair do Jogo", True, (255, 100, 100))
-            inst2_rect = inst2.get_rect(center=(WIDTH // 2, panel_y + 370))
-            self.screen.blit(inst2, inst2_rect)
+            inst1 = scene["inst1"]
+            inst1.set_alpha(int(200 + 55 * math.sin(anim_time * 4)))
+            self.screen.blit(inst1, inst1.get_rect(center=(WIDTH // 2, panel_y + 340)))
 
             pygame.display.flip()
 
+    @staticmethod
+    def _pulse_frames(surf):
+        """surf escalado de 0.9 a 1.1 em TITLE_PULSE_STEPS passos (títulos pulsantes)."""
+        frames = []
+        for i in range(TITLE_PULSE_STEPS):
+            pulse = 0.9 + 0.2 * i / (TITLE_PULSE_STEPS - 1)
+            size = (int(surf.get_width() * pulse), int(surf.get_height() * pulse))
+            frames.append(pygame.transform.scale(surf, size))
+        return frames
+
+    def _victory_scene(self):
+        """
+        Partes fixas da tela de vitória, montadas uma vez por jogo: gradiente,
+        painel (sombra, borda, linha e textos), título em TITLE_PULSE_STEPS
+        escalas para o pulso e os frames dos dinos já em 60x60.
+        """
+        if getattr(self, "_victory_cache", None) is not None:
+            return self._victory_cache
+
+        # Background gradiente
+        gradient = pygame.Surface((WIDTH, HEIGHT)).convert()
+        for y in range(HEIGHT):
+            ratio = y / HEIGHT
+            r = int(20 + (50 - 20) * ratio)
+            g = int(20 + (30 - 20) * ratio)
+            b = int(60 + (80 - 60) * ratio)
+            pygame.draw.line(gradient, (r, g, b), (0, y), (WIDTH, y))
+
+        # Painel central: sombra, corpo e uma camada transparente com linha
+        # e textos fixos (três surfaces para a mistura sair igual à de antes)
+        panel_w, panel_h = 700, 400
+        panel_x = (WIDTH - panel_w) // 2
+        panel_y = (HEIGHT - panel_h) // 2
+        shadow = pygame.Surface((panel_w + 10, panel_h + 10), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, (0, 0, 0, 100), (0, 0, panel_w + 10, panel_h + 10), border_radius=20)
+        body = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        pygame.draw.rect(body, (40, 40, 70, 230), (0, 0, panel_w, panel_h), border_radius=20)
+        pygame.draw.rect(body, (255, 215, 0), (0, 0, panel_w, panel_h), 5, border_radius=20)
+
+        # Linha decorativa e textos fixos (coordenadas relativas ao painel)
+        labels = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        line_y = 140
+        pygame.draw.line(labels, (255, 215, 0), (50, line_y), (panel_w - 50, line_y), 3)
+        for font, text, color, y in (
+            (self.font, "Parabéns!", (255, 255, 255), 180),
+            (self.small_font, "Você completou todos os 6 níveis!", (200, 255, 200), 220),
+            (self.small_font, "🤝 Equipe Perfeita! 🤝", (255, 200, 100), 280),
+            (self.small_font, "ESC - Sair do Jogo", (255, 100, 100), 370),
+        ):
+            surf = render_text(font, text, True, color)
+            labels.blit(surf, surf.get_rect(center=(panel_w // 2, y)))
+
+        # Título: escalas de 0.9 a 1.1 (pulso = 1 + 0.1*sin)
+        title_font = pygame.font.Font(None, 100)
+        title_text = "🏆 VITÓRIA! 🏆"
+        title_shadow = title_font.render(title_text, True, (0, 0, 0))
+        title = title_font.render(title_text, True, (255, 215, 0))
+        titles = list(zip(self._pulse_frames(title_shadow), self._pulse_frames(title)))
+
+        def dino_frames(player):
+            if player is None:
+                return []
+            return [pygame.transform.scale(f, (60, 60)) for f in player.frames_right]
+
+        self._victory_cache = {
+            "gradient": gradient,
+            "panel": (shadow, body, labels),
+            "panel_pos": (panel_x, panel_y),
+            "panel_w": panel_w,
+            "titles": titles,
+            "dino_red": dino_frames(getattr(self, "p1", None)),
+            "dino_blue": dino_frames(getattr(self, "p2", None)),
+            "inst1": render_text(self.small_font, "ENTER - Jogar Novamente", True, (100, 255, 100)).copy(),
+        }
+        return self._victory_cache
+
     def show_timeover_screen(self):
         """Mostra tela quando o tempo acaba"""
-        self.music_channel.stop()
+        self.music.stop()
         self.play_sfx('defeat')
         timeover = True
         while timeover and self.running:
@@ -278,24 +432,24 @@ class Game:
                         if show_tut:
                             if show_tutorial():
                                 self.current_level = 1
-                                self.load_current_level()
+                                self.restart_level()
                         elif start_game:
                             self.current_level = 1
-                            self.load_current_level()
+                            self.restart_level()
                         else:
                             self.running = False
                         timeover = False
 
             self.screen.fill((40, 20, 20))
-            title = self.font.render("TEMPO ESGOTADO", True, (255, 180, 180))
+            title = render_text(self.font, "TEMPO ESGOTADO", True, (255, 180, 180))
             title_rect = title.get_rect(center=(WIDTH // 2, HEIGHT // 3))
             self.screen.blit(title, title_rect)
 
-            msg = self.small_font.render("O tempo acabou!", True, (220, 220, 220))
+            msg = render_text(self.small_font, "O tempo acabou!", True, (220, 220, 220))
             msg_rect = msg.get_rect(center=(WIDTH // 2, HEIGHT // 2))
             self.screen.blit(msg, msg_rect)
 
-            inst = self.small_font.render("ENTER - Menu | ESC - Sair", True, (160, 160, 160))
+            inst = render_text(self.small_font, "ENTER - Menu | ESC - Sair", True, (160, 160, 160))
             inst_rect = inst.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
             self.screen.blit(inst, inst_rect)
 
@@ -303,10 +457,10 @@ class Game:
             self.clock.tick(FPS)
 
     def draw_ui(self):
-        """Desenha interface do usuário"""
+        """Desenha interface do usuário; devolve as áreas desenhadas."""
         # Nível atual
-        level_text = self.font.render(f"Nível {self.current_level}/{self.total_levels}", True, (255, 255, 255))
-        self.screen.blit(level_text, (10, 10))
+        level_text = render_text(self.font, f"Nível {self.current_level}/{self.total_levels}", True, (255, 255, 255))
+        rects = [self.screen.blit(level_text, (10, 10))]
 
         # Temporizador (canto superior direito)
         if self.level_time_limit > 0:
@@ -321,21 +475,47 @@ class Game:
                 color = TIMER_WARN
             else:
                 color = TIMER_OK
-            t_surf = self.font.render(timer_str, True, color)
+            t_surf = render_text(self.font, timer_str, True, color)
             t_rect = t_surf.get_rect(topright=(WIDTH - 10, 10))
-            self.screen.blit(t_surf, t_rect)
+            rects.append(self.screen.blit(t_surf, t_rect))
+        return rects
+
+    def draw_frame(self):
+        """
+        Desenha o frame do jogo. Normalmente redesenha tudo e devolve None
+        (flip). No modo dirty-rects, só restaura da camada estática as áreas
+        ocupadas no frame anterior, desenha a camada ao vivo e devolve a lista
+        de retângulos (antigos + novos) para display.update.
+        """
+        live = (self.animated_tiles, self.enemies, self.players)
+        full = not self.dirty_rects or self.full_redraw
+        if full:
+            self.screen.blit(self.level_surface, (0, 0))
+        else:
+            for rect in self.prev_rects:
+                self.screen.blit(self.level_surface, rect, rect)
+
+        # Camada ao vivo por cima da estática (opaca, já com o fundo)
+        for group in live:
+            group.draw(self.screen)
+        ui_rects = self.draw_ui()
+
+        rects = [s.rect.copy() for g in live for s in g] + ui_rects
+        dirty = self.prev_rects + rects
+        self.prev_rects = rects
+        if full:
+            self.full_redraw = False
+            return None
+        return dirty
 
     def play_sfx(self, sound_name):
         """Toca um efeito sonoro"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        self.sfx.play(sound_name)
     
     def play_level_music(self):
         """Inicia música do nível atual"""
-        if 'music' in self.sounds and self.current_level in self.sounds['music']:
-            music = self.sounds['music'][self.current_level]
-            music.set_volume(self.music_volume)
-            self.music_channel.play(music, loops=-1)
+        if self.sounds:  # sem sons (erro no mixer/NumPy) fica em silêncio
+            self.music.play(self.current_level)
 
     def check_level_complete(self):
         """Conclui quando os dois jogadores estão no portal correto"""
@@ -347,6 +527,7 @@ class Game:
         self.current_level += 1
         if self.current_level > self.total_levels:
             self.show_victory_screen()
+            self.full_redraw = True
         else:
             self.load_current_level()
     
@@ -355,13 +536,50 @@ class Game:
         # Pausa a música
         self.music_channel.pause()
         
+        # Snapshot do frame atual (a tela ainda mostra o último frame do jogo)
+        # com overlay, painel e opções já aplicados; por frame só o título pulsa
+        snapshot = self.screen.copy()
         overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        snapshot.blit(overlay, (0, 0))
         
         # Panel for menu
         panel_w, panel_h = 500, 400
         panel_x = (WIDTH - panel_w) // 2
         panel_y = (HEIGHT - panel_h) // 2
+        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        pygame.draw.rect(panel_surf, (35, 40, 55, 240), (0, 0, panel_w, panel_h), border_radius=20)
+        pygame.draw.rect(panel_surf, (100, 200, 255), (0, 0, panel_w, panel_h), 4, border_radius=20)
+        snapshot.blit(panel_surf, (panel_x, panel_y))
+        
+        # Menu options with icons (usando símbolos simples que funcionam)
+        options = [
+            (">", "ESC/P", "Continuar", (100, 220, 100)),
+            ("R", "R", "Reiniciar Nivel", (220, 180, 100)),
+            ("X", "Q", "Voltar ao Menu", (220, 100, 100))
+        ]
+        
+        y_offset = panel_y + 160
+        for icon, key, text, color in options:
+            # Icon
+            icon_surf = render_text(self.font, icon, True, color)
+            snapshot.blit(icon_surf, (panel_x + 50, y_offset - 5))
+            
+            # Key
+            key_surf = render_text(self.small_font, f"[{key}]", True, (180, 180, 180))
+            snapshot.blit(key_surf, (panel_x + 120, y_offset + 5))
+            
+            # Text
+            text_surf = render_text(self.small_font, text, True, (220, 220, 220))
+            snapshot.blit(text_surf, (panel_x + 200, y_offset + 5))
+            
+            y_offset += 70
+        
+        # Título pulsante: escalas pré-calculadas e a área que elas podem cobrir
+        titles = self._pulse_frames(render_text(self.font, "|| PAUSADO", True, (255, 255, 255)))
+        title_area = titles[-1].get_rect(center=(WIDTH // 2, panel_y + 70))
+        self.screen.blit(snapshot, (0, 0))
+        pygame.display.flip()
         
         paused = True
         anim_time = 0.0
@@ -380,9 +598,9 @@ class Game:
                         self.paused = False
                         self.music_channel.unpause()  # Retoma música
                     elif event.key == pygame.K_r:
-                        # Restart level
+                        # Restart level (reset em memória, sem recarregar)
                         self.music_channel.unpause()
-                        self.load_current_level()
+                        self.restart_level()
                         paused = False
                         self.paused = False
                     elif event.key == pygame.K_q:
@@ -391,65 +609,25 @@ class Game:
                         if show_tut:
                             if show_tutorial():
                                 self.current_level = 1
-                                self.load_current_level()
+                                self.restart_level()
                         elif start_game:
                             self.current_level = 1
-                            self.load_current_level()
+                            self.restart_level()
                         else:
                             self.running = False
                         paused = False
                         self.paused = False
             
-            # Draw game state underneath
-            if getattr(self, 'current_background', None) is not None:
-                self.screen.blit(self.current_background, (0, 0))
-            else:
-                self.screen.fill(BG)
-            self.screen.blit(self.level_surface, (0, 0))
-            self.players.draw(self.screen)
-            self.draw_ui()
-            
-            # Draw pause overlay
-            self.screen.blit(overlay, (0, 0))
-            
-            # Draw panel
-            panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surf, (35, 40, 55, 240), (0, 0, panel_w, panel_h), border_radius=20)
-            pygame.draw.rect(panel_surf, (100, 200, 255), (0, 0, panel_w, panel_h), 4, border_radius=20)
-            self.screen.blit(panel_surf, (panel_x, panel_y))
+            if not paused:
+                break
             
-            # Draw pause title with pulsing effect
+            # Draw pause title with pulsing effect (só a área do título muda)
             import math
-            pulse = 1.0 + 0.1 * math.sin(anim_time * 3)
-            title = self.font.render("|| PAUSADO", True, (255, 255, 255))
-            title_scaled = pygame.transform.scale(title, (int(title.get_width() * pulse), int(title.get_height() * pulse)))
-            title_rect = title_scaled.get_rect(center=(WIDTH // 2, panel_y + 70))
-            self.screen.blit(title_scaled, title_rect)
-            
-            # Menu options with icons (usando símbolos simples que funcionam)
-            options = [
-                (">", "ESC/P", "Continuar", (100, 220, 100)),
-                ("R", "R", "Reiniciar Nivel", (220, 180, 100)),
-                ("X", "Q", "Voltar ao Menu", (220, 100, 100))
-            ]
-            
-            y_offset = panel_y + 160
-            for icon, key, text, color in options:
-                # Icon
-                icon_surf = self.font.render(icon, True, color)
-                self.screen.blit(icon_surf, (panel_x + 50, y_offset - 5))
-                
-                # Key
-                key_surf = self.small_font.render(f"[{key}]", True, (180, 180, 180))
-                self.screen.blit(key_surf, (panel_x + 120, y_offset + 5))
-                
-                # Text
-                text_surf = self.small_font.render(text, True, (220, 220, 220))
-                self.screen.blit(text_surf, (panel_x + 200, y_offset + 5))
-                
-                y_offset += 70
-            
-            pygame.display.flip()
+            pulse_step = round((math.sin(anim_time * 3) + 1) / 2 * (len(titles) - 1))
+            title_scaled = titles[pulse_step]
+            self.screen.blit(snapshot, title_area, title_area)
+            self.screen.blit(title_scaled, title_scaled.get_rect(center=title_area.center))
+            pygame.display.update(title_area)
 
     def run(self):
         while self.running:
@@ -463,6 +641,7 @@ class Game:
                         self.paused = True
                         self.pause_ticks = pygame.time.get_ticks()
                         self.show_pause_menu()
+                        self.full_redraw = True
                         # Adjust timer for pause duration
                         pause_duration = (pygame.time.get_ticks() - self.pause_ticks) / 1000.0
                         self.level_start_ticks += int(pause_duration * 1000)
@@ -472,23 +651,22 @@ class Game:
             self.level_time_left = max(0.0, self.level_time_limit - elapsed)
             if self.level_time_limit > 0 and self.level_time_left <= 0.0:
                 self.show_timeover_screen()
+                self.full_redraw = True
                 continue
 
             keys = pygame.key.get_pressed()
 
             # Atualiza tiles animados (portais) e inimigos
-            for tile in self.all_tiles:
-                if hasattr(tile, 'update'):
-                    tile.update(dt)
-            
+            self.animated_tiles.update(dt)
+
             for enemy in self.enemies:
                 enemy.update(dt)
 
             # Atualiza jogadores (se não estiver no delay de conclusão)
             if self.level_complete_timer <= 0:
-                self.p1.update(keys, self.solids, self.color_tiles, self.hazards,
+                self.p1.update(keys, self.solids, self.tile_kinds,
                                self.doors, self.ramps, (pygame.K_a, pygame.K_d, pygame.K_w), dt)
-                self.p2.update(keys, self.solids, self.color_tiles, self.hazards,
+                self.p2.update(keys, self.solids, self.tile_kinds,
                                self.doors, self.ramps, (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP), dt)
                 
                 # Verifica colisão com inimigos
@@ -507,18 +685,15 @@ class Game:
                 if self.level_complete_timer <= 0:
                     self.advance_level()
 
-            # Desenha tudo
-            if getattr(self, 'current_background', None) is not None:
-                self.screen.blit(self.current_background, (0, 0))
+            # Desenha tudo: camada estática (opaca, já com o fundo) + camada ao vivo
+            dirty = self.draw_frame()
+            if dirty is None:
+                pygame.display.flip()
             else:
-                self.screen.fill(BG)
-            self.screen.blit(self.level_surface, (0, 0))
-            self.enemies.draw(self.screen)  # Desenha inimigos
-            self.players.draw(self.screen)
-            self.draw_ui()
-
-            pygame.display.flip()
+                pygame.display.update(dirty)
 
+        self.music.stop(wait=True)
+        self.level_loader.shutdown(wait=False)
         pygame.quit()
 
 
@@ -1,59 +1,17 @@
 import pygame
-from settings import TILE, WIDTH, HEIGHT, COLS, ROWS, NEUTRAL, RED, BLUE, HAZARD, GOAL_R, GOAL_B, BG
-from sprites import Tile, AnimatedTile, PatrolEnemy, FallingEnemy, VerticalPatrolEnemy
-from assets import load_tile_textures, load_image
-
-# Legenda dos níveis:
-# '.' = vazio
-# '#' = bloco sólido
-# 'X' = spike (mata)
-# '/' = rampa sobe (para direita)
-# '\' = rampa desce (para direita)
-# 'R' = tile vermelho (só dino vermelho pode pisar)
-# 'B' = tile azul (só dino azul pode pisar)
-# 'G' = portal VERMELHO (goal para dino vermelho)
-# 'H' = portal AZUL (goal para dino azul)
-# '1' = spawn do dino vermelho
-# '2' = spawn do dino azul
-# 'M' = meteoro patrulheiro horizontal
-# 'F' = meteoro que cai do teto
-# 'V' = patrulha vertical (voa)
-
-def _normalize_lines(lines):
-    lines = [line.rstrip("\n") for line in lines]
-    lines = lines[:ROWS]
-    lines = [line[:COLS].ljust(COLS, ".") for line in lines]
-    while len(lines) < ROWS:
-        lines.append("." * COLS)
-    return lines
-
-def _is_solid(ch):
-    return ch == "#"
-
-def _choose_solid_texture(x, y, grid, tex):
-    up    = y > 0            and _is_solid(grid[y-1][x])
-    down  = y < ROWS-1       and _is_solid(grid[y+1][x])
-    left  = x > 0            and _is_solid(grid[y][x-1])
-    right = x < COLS-1       and _is_solid(grid[y][x+1])
-
-    if up and down and left and right:
-        key = "fechado"
-    elif not up and down and left and right:
-        key = "fechado_cima"
-    elif up and not down and left and right:
-        key = "fechado_embaixo"
-    elif up and down and not left and right:
-        key = "fechado_esquerda"
-    elif up and down and left and not right:
-        key = "fechado_direita"
-    elif not up and not down and left and right:
-        key = "aberto_meio_grama_cima_baixo"
-    elif up and down and not left and not right:
-        key = "aberto_meio_grama_lados"
-    else:
-        key = "chao_pedra"
-
-    return tex.get(key, tex["fechado"])
+from settings import TILE, WIDTH, HEIGHT, NEUTRAL, RED, BLUE, HAZARD, GOAL_R, GOAL_B, BG
+from settings import (
+    KIND_SOLID, KIND_RED, KIND_BLUE, KIND_SPIKE, KIND_RAMP_UP, KIND_RAMP_DOWN,
+    KIND_GOAL_RED, KIND_GOAL_BLUE
+)
+from sprites import Tile, Collider, AnimatedTile, PatrolEnemy, FallingEnemy, VerticalPatrolEnemy
+from assets import ASSETS, load_tile_textures, load_image, load_image_scaled
+from levelmap import (
+    SOLID_TEXTURE_KEYS, ENEMY_PATROL, ENEMY_FALLING, ENEMY_VERTICAL, load_compiled_level
+)
+
+# A legenda dos mapas e a compilação do texto (tipos, autotile, colisores,
+# cache em disco) ficam em levelmap.py; aqui só montamos os sprites.
 
 def _slice_portal_spritesheet(sheet):
     """Fatia spritesheet horizontal de 8 frames quadrados"""
@@ -71,6 +29,9 @@ def _slice_portal_spritesheet(sheet):
     return frames
 
 def _load_portal_frames():
+    return ASSETS.get(("portal_frames",), _load_portal_frames_uncached)
+
+def _load_portal_frames_uncached():
     try:
         portal_red_sheet = load_image("portal_vermelho.png")
         portal_red_frames = _slice_portal_spritesheet(portal_red_sheet)
@@ -87,7 +48,46 @@ def _load_portal_frames():
     
     return portal_red_frames, portal_blue_frames
 
-def load_level(level_path, groups):
+def _load_enemy_image(kind):
+    """Imagem do meteoro por tipo de inimigo (None se o arquivo faltar)."""
+    try:
+        if kind == ENEMY_FALLING:
+            return load_image_scaled("meteoro2.png", (TILE, TILE))
+        img = load_image_scaled("meteoro.png", (TILE, TILE))
+        if kind == ENEMY_VERTICAL:
+            # Rotaciona para parecer diferente
+            img = ASSETS.get(("meteoro_vertical",), lambda: pygame.transform.rotate(img, 45))
+        return img
+    except Exception:
+        if kind == ENEMY_FALLING:
+            print("Aviso: meteoro2.png não encontrado")
+        elif kind == ENEMY_VERTICAL:
+            print("Aviso: meteoro.png não encontrado para patrulha vertical")
+        else:
+            print("Aviso: meteoro.png não encontrado")
+        return None
+
+def load_level_textures():
+    """
+    Carrega tudo que a montagem dos níveis usa (texturas de tiles, frames dos
+    portais, meteoros). Carregue uma vez e passe para build_level/load_level.
+    """
+    portal_red_frames, portal_blue_frames = _load_portal_frames()
+    return {
+        "tiles": load_tile_textures(),
+        "portal_red": portal_red_frames,
+        "portal_blue": portal_blue_frames,
+        "enemies": {k: _load_enemy_image(k) for k in (ENEMY_PATROL, ENEMY_FALLING, ENEMY_VERTICAL)},
+    }
+
+def build_level(data, groups, merge_colliders=True, textures=None):
+    """
+    Monta os sprites a partir do nível compilado (ver levelmap.compile_level)
+    e devolve os spawns {"red": (x, y), "blue": (x, y)}.
+    merge_colliders: se True, 'solids' recebe os retângulos mesclados (Collider)
+    em vez de um sprite por '#'; os Tile continuam em 'all_tiles' para textura.
+    textures: resultado de load_level_textures (carregado aqui se None).
+    """
     all_tiles   = groups["all_tiles"]
     solids      = groups["solids"]
     color_tiles = groups["color_tiles"]
@@ -95,124 +95,95 @@ def load_level(level_path, groups):
     doors       = groups["doors"]
     ramps       = groups["ramps"]
 
-    spawns = {"red": None, "blue": None}
-
-    try:
-        with open(level_path, "r", encoding="utf-8") as f:
-            lines = _normalize_lines(f.readlines())
-    except FileNotFoundError:
-        print(f"ERRO: Arquivo de nível não encontrado: {level_path}")
-        # Cria um nível vazio de emergência
-        lines = ["." * COLS for _ in range(ROWS)]
-        # Adiciona chão
-        lines[-1] = "#" * COLS
-        # Adiciona spawns
-        lines[-2] = list(lines[-2])
-        lines[-2][5] = "1"
-        lines[-2][10] = "2"
-        lines[-2] = "".join(lines[-2])
-
-    tex = load_tile_textures()
-    portal_red_frames, portal_blue_frames = _load_portal_frames()
-
-    grid = lines
-
-    for j, row in enumerate(grid):
-        for i, ch in enumerate(row):
-            x = i * TILE
-            y = j * TILE
-
-            if ch == "#":
-                image = _choose_solid_texture(i, j, grid, tex)
-                t = Tile(x, y, image, solid=True)
-                groups["all_tiles"].add(t)
-                groups["solids"].add(t)
-
-            elif ch == "R":
-                image = tex.get("tile_vermelho") if "tile_vermelho" in tex else None
-                t = Tile(x, y, image, solid=True, color_kind="red")
-                groups["all_tiles"].add(t)
-                groups["color_tiles"].add(t)
-
-            elif ch == "B":
-                image = tex.get("tile_azul") if "tile_azul" in tex else None
-                t = Tile(x, y, image, solid=True, color_kind="blue")
-                groups["all_tiles"].add(t)
-                groups["color_tiles"].add(t)
-
-            elif ch == "X":
-                image = tex.get("espinho", None)
-                t = Tile(x, y, image, deadly=True)
-                groups["all_tiles"].add(t)
-                groups["hazards"].add(t)
-
-            elif ch == "/":
-                image = tex.get("rampa_sobe", None)
-                t = Tile(x, y, image, solid=True, slope="up")
-                groups["all_tiles"].add(t)
-                groups["ramps"].add(t)
-
-            elif ch == "\\":
-                image = tex.get("rampa_desce", None)
-                t = Tile(x, y, image, solid=True, slope="down")
-                groups["all_tiles"].add(t)
-                groups["ramps"].add(t)
-
-            elif ch == "G":
-                if portal_red_frames:
-                    t = AnimatedTile(x - (TILE), y - (TILE*2), portal_red_frames, goal_for="red")
-                else:
-                    t = Tile(x, y, None, goal_for="red")
-                groups["all_tiles"].add(t)
-                groups["doors"].add(t)
-
-            elif ch == "H":
-                if portal_blue_frames:
-                    t = AnimatedTile(x - (TILE), y - (TILE*2), portal_blue_frames, goal_for="blue")
-                else:
-                    t = Tile(x, y, None, goal_for="blue")
-                groups["all_tiles"].add(t)
-                groups["doors"].add(t)
-
-            elif ch == "1":
-                spawns["red"]  = (x + TILE // 2, y + TILE)
-            elif ch == "2":
-                spawns["blue"] = (x + TILE // 2, y + TILE)
-            
-            # Inimigos
-            elif ch == "M":
-                # Meteoro patrulheiro horizontal
-                try:
-                    meteor_img = load_image("meteoro.png")
-                    meteor_img = pygame.transform.scale(meteor_img, (TILE, TILE))
-                    enemy = PatrolEnemy(x, y, meteor_img, patrol_distance=5)
-                    if "enemies" in groups:
-                        groups["enemies"].add(enemy)
-                except Exception:
-                    print("Aviso: meteoro.png não encontrado")
-            
-            elif ch == "F":
-                # Meteoro que cai do teto
-                try:
-                    meteor_img = load_image("meteoro2.png")
-                    meteor_img = pygame.transform.scale(meteor_img, (TILE, TILE))
-                    enemy = FallingEnemy(x, y, meteor_img, fall_delay=2.0)
-                    if "enemies" in groups:
-                        groups["enemies"].add(enemy)
-                except Exception:
-                    print("Aviso: meteoro2.png não encontrado")
-            
-            elif ch == "V":
-                # Patrulha vertical (voa)
-                try:
-                    meteor_img = load_image("meteoro.png")
-                    meteor_img = pygame.transform.scale(meteor_img, (TILE, TILE))
-                    meteor_img = pygame.transform.rotate(meteor_img, 45)  # Rotaciona para parecer diferente
-                    enemy = VerticalPatrolEnemy(x, y, meteor_img, patrol_distance=4)
-                    if "enemies" in groups:
-                        groups["enemies"].add(enemy)
-                except Exception:
-                    print("Aviso: meteoro.png não encontrado para patrulha vertical")
+    if textures is None:
+        textures = load_level_textures()
+    tex = textures["tiles"]
+    portal_red_frames = textures["portal_red"]
+    portal_blue_frames = textures["portal_blue"]
+    solid_textures = [tex.get(key, tex["fechado"]) for key in SOLID_TEXTURE_KEYS]
+
+    kinds = data["kinds"]
+    masks = data["masks"]
+
+    for j, i in zip(*kinds.nonzero()):
+        kind = kinds[j, i]
+        x = int(i) * TILE
+        y = int(j) * TILE
+
+        if kind == KIND_SOLID:
+            t = Tile(x, y, solid_textures[masks[j, i]], solid=True)
+            all_tiles.add(t)
+            if not merge_colliders:
+                solids.add(t)
+
+        elif kind == KIND_RED:
+            t = Tile(x, y, tex.get("tile_vermelho"), solid=True, color_kind="red")
+            all_tiles.add(t)
+            color_tiles.add(t)
+            solids.add(t)  # camada COLLISION_RED: filtrada por cada player
+
+        elif kind == KIND_BLUE:
+            t = Tile(x, y, tex.get("tile_azul"), solid=True, color_kind="blue")
+            all_tiles.add(t)
+            color_tiles.add(t)
+            solids.add(t)  # camada COLLISION_BLUE: filtrada por cada player
+
+        elif kind == KIND_SPIKE:
+            t = Tile(x, y, tex.get("espinho"), deadly=True)
+            all_tiles.add(t)
+            hazards.add(t)
+
+        elif kind == KIND_RAMP_UP:
+            t = Tile(x, y, tex.get("rampa_sobe"), solid=True, slope="up")
+            all_tiles.add(t)
+            ramps.add(t)
+
+        elif kind == KIND_RAMP_DOWN:
+            t = Tile(x, y, tex.get("rampa_desce"), solid=True, slope="down")
+            all_tiles.add(t)
+            ramps.add(t)
+
+        elif kind == KIND_GOAL_RED:
+            if portal_red_frames:
+                t = AnimatedTile(x - (TILE), y - (TILE*2), portal_red_frames, goal_for="red")
+            else:
+                t = Tile(x, y, None, goal_for="red")
+            all_tiles.add(t)
+            doors.add(t)
+            if isinstance(t, AnimatedTile) and "animated" in groups:
+                groups["animated"].add(t)
+
+        elif kind == KIND_GOAL_BLUE:
+            if portal_blue_frames:
+                t = AnimatedTile(x - (TILE), y - (TILE*2), portal_blue_frames, goal_for="blue")
+            else:
+                t = Tile(x, y, None, goal_for="blue")
+            all_tiles.add(t)
+            doors.add(t)
+            if isinstance(t, AnimatedTile) and "animated" in groups:
+                groups["animated"].add(t)
+
+    if merge_colliders:
+        for rect in data["colliders"]:
+            solids.add(Collider(rect.tolist()))
+
+    # Inimigos
+    if "enemies" in groups:
+        for kind, x, y in data["enemies"].tolist():
+            img = textures["enemies"][kind]
+            if img is None:
+                continue
+            if kind == ENEMY_PATROL:
+                enemy = PatrolEnemy(x, y, img, patrol_distance=5)            # Meteoro patrulheiro horizontal
+            elif kind == ENEMY_FALLING:
+                enemy = FallingEnemy(x, y, img, fall_delay=2.0)              # Meteoro que cai do teto
+            else:
+                enemy = VerticalPatrolEnemy(x, y, img, patrol_distance=4)    # Patrulha vertical (voa)
+            groups["enemies"].add(enemy)
+
+    spawns = {}
+    for name, (sx, sy) in zip(("red", "blue"), data["spawns"].tolist()):
+        spawns[name] = (sx, sy) if sx >= 0 else None
 
     # Spawns padrão caso não encontre no mapa
     if spawns["red"]  is None: 
@@ -224,8 +195,30 @@ def load_level(level_path, groups):
     
     return spawns
 
-def build_level_surface(all_tiles):
-    # Camada transparente apenas com os tiles/objetos (sem pintar fundo).
-    surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    all_tiles.draw(surf)
+def load_level(level_path, groups, merge_colliders=True, data=None, textures=None):
+    """
+    Carrega o nível compilado (cache binário invalidado por hash, ver
+    levelmap.load_compiled_level), monta os sprites nos grupos e devolve
+    (spawns, kinds), onde kinds é a grade uint8 de tipos de tile.
+    data: nível já compilado (ex.: views do levels.pack ou pré-carregado em
+    outra thread); pula a leitura. textures: ver load_level_textures.
+    """
+    if data is None:
+        data = load_compiled_level(level_path)
+    spawns = build_level(data, groups, merge_colliders, textures)
+    return spawns, data["kinds"]
+
+def build_level_surface(all_tiles, background=None):
+    """
+    Camada estática da fase num surface opaco: fundo (ou cor BG) + todos os
+    tiles que não animam. Por frame basta um blit sem alpha dela; os
+    AnimatedTile (portais) ficam de fora e são desenhados por cima, ao vivo.
+    """
+    surf = pygame.Surface((WIDTH, HEIGHT)).convert()
+    if background is not None:
+        surf.blit(background, (0, 0))
+    else:
+        surf.fill(BG)
+    static = pygame.sprite.Group([t for t in all_tiles if not isinstance(t, AnimatedTile)])
+    static.draw(surf)
     return surf
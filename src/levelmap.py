@@ -0,0 +1,332 @@
+import hashlib
+import mmap
+import os
+import struct
+import zipfile
+import numpy as np
+from settings import TILE, COLS, ROWS
+from settings import (
+    KIND_SOLID, KIND_RED, KIND_BLUE, KIND_SPIKE, KIND_RAMP_UP, KIND_RAMP_DOWN,
+    KIND_GOAL_RED, KIND_GOAL_BLUE
+)
+
+# Dados compilados do nível (sem sprites/pygame): grade de tipos, máscaras de
+# autotile, spawns, inimigos e colisores mesclados. level.py monta os sprites
+# a partir disso; o resultado também é salvo em cache binário no disco.
+
+# Legenda dos níveis:
+# '.' = vazio
+# '#' = bloco sólido
+# 'X' = spike (mata)
+# '/' = rampa sobe (para direita)
+# '\' = rampa desce (para direita)
+# 'R' = tile vermelho (só dino vermelho pode pisar)
+# 'B' = tile azul (só dino azul pode pisar)
+# 'G' = portal VERMELHO (goal para dino vermelho)
+# 'H' = portal AZUL (goal para dino azul)
+# '1' = spawn do dino vermelho
+# '2' = spawn do dino azul
+# 'M' = meteoro patrulheiro horizontal
+# 'F' = meteoro que cai do teto
+# 'V' = patrulha vertical (voa)
+
+# Caractere do mapa -> tipo na grade uint8 (demais caracteres = KIND_EMPTY)
+_KIND_LUT = np.zeros(256, dtype=np.uint8)
+for _ch, _kind in {
+    "#": KIND_SOLID, "R": KIND_RED, "B": KIND_BLUE, "X": KIND_SPIKE,
+    "/": KIND_RAMP_UP, "\\": KIND_RAMP_DOWN, "G": KIND_GOAL_RED, "H": KIND_GOAL_BLUE,
+}.items():
+    _KIND_LUT[ord(_ch)] = _kind
+
+# Tipos de inimigo na lista compilada (colunas: tipo, x, y)
+ENEMY_PATROL   = 0   # 'M'
+ENEMY_FALLING  = 1   # 'F'
+ENEMY_VERTICAL = 2   # 'V'
+_ENEMY_CHARS = {"M": ENEMY_PATROL, "F": ENEMY_FALLING, "V": ENEMY_VERTICAL}
+
+# Versão do formato compilado; incremente ao mudar compile_level
+CACHE_VERSION = 1
+
+
+def normalize_lines(lines):
+    lines = [line.rstrip("\n") for line in lines]
+    lines = lines[:ROWS]
+    lines = [line[:COLS].ljust(COLS, ".") for line in lines]
+    while len(lines) < ROWS:
+        lines.append("." * COLS)
+    return lines
+
+def default_level_lines():
+    """Nível vazio de emergência: chão e os dois spawns."""
+    lines = ["." * COLS for _ in range(ROWS)]
+    # Adiciona chão
+    lines[-1] = "#" * COLS
+    # Adiciona spawns
+    lines[-2] = list(lines[-2])
+    lines[-2][5] = "1"
+    lines[-2][10] = "2"
+    lines[-2] = "".join(lines[-2])
+    return lines
+
+def _char_grid(lines):
+    return np.frombuffer("".join(lines).encode("ascii", "replace"), dtype=np.uint8).reshape(ROWS, COLS)
+
+# ----------------- Autotiling -----------------
+# Máscara de 4 bits com os vizinhos sólidos de cada célula
+_N_UP, _N_DOWN, _N_LEFT, _N_RIGHT = 1, 2, 4, 8
+
+# Máscara -> textura. Não há arte para pontas/cantos, então essas
+# combinações ficam explicitamente em "chao_pedra".
+SOLID_TEXTURE_KEYS = (
+    "chao_pedra",                     # 0  isolado
+    "chao_pedra",                     # 1  cima
+    "chao_pedra",                     # 2  baixo
+    "aberto_meio_grama_lados",        # 3  cima+baixo
+    "chao_pedra",                     # 4  esquerda
+    "chao_pedra",                     # 5  cima+esquerda
+    "chao_pedra",                     # 6  baixo+esquerda
+    "fechado_direita",                # 7  cima+baixo+esquerda
+    "chao_pedra",                     # 8  direita
+    "chao_pedra",                     # 9  cima+direita
+    "chao_pedra",                     # 10 baixo+direita
+    "fechado_esquerda",               # 11 cima+baixo+direita
+    "aberto_meio_grama_cima_baixo",   # 12 esquerda+direita
+    "fechado_embaixo",                # 13 cima+esquerda+direita
+    "fechado_cima",                   # 14 baixo+esquerda+direita
+    "fechado",                        # 15 cercado
+)
+
+def autotile_masks(kinds):
+    """
+    Calcula de uma vez a máscara de vizinhos sólidos (bits _N_*) de toda a
+    grade. Fora do mapa conta como não sólido. Índice em SOLID_TEXTURE_KEYS.
+    """
+    solid = np.pad(kinds == KIND_SOLID, 1, constant_values=False)
+    core = solid[1:-1, 1:-1]
+    masks = np.zeros(kinds.shape, dtype=np.uint8)
+    masks |= solid[:-2, 1:-1] * np.uint8(_N_UP)
+    masks |= solid[2:, 1:-1] * np.uint8(_N_DOWN)
+    masks |= solid[1:-1, :-2] * np.uint8(_N_LEFT)
+    masks |= solid[1:-1, 2:] * np.uint8(_N_RIGHT)
+    masks[~core] = 0
+    return masks
+
+# ----------------- Colisores -----------------
+def merge_solid_rects(kinds):
+    """
+    Mescla gulosa das células sólidas em poucos retângulos grandes.
+    Estende cada célula livre para a direita o máximo possível e depois
+    desce enquanto a faixa inteira da linha de baixo também for sólida.
+    Retorna array (N, 4) int16 de (x, y, w, h) em pixels.
+    """
+    free = kinds == KIND_SOLID
+    rects = []
+    for j in range(ROWS):
+        for i in range(COLS):
+            if not free[j, i]:
+                continue
+            w = 1
+            while i + w < COLS and free[j, i + w]:
+                w += 1
+            h = 1
+            while j + h < ROWS and free[j + h, i:i + w].all():
+                h += 1
+            free[j:j + h, i:i + w] = False
+            rects.append((i * TILE, j * TILE, w * TILE, h * TILE))
+    return np.array(rects, dtype=np.int16).reshape(-1, 4)
+
+# ----------------- Compilação -----------------
+def _spawn_point(chars, ch):
+    cells = np.argwhere(chars == ord(ch))
+    if len(cells) == 0:
+        return (-1, -1)
+    j, i = cells[-1]  # a última ocorrência vale, como no loop original
+    return (int(i) * TILE + TILE // 2, int(j) * TILE + TILE)
+
+def compile_level(lines):
+    """
+    Compila as linhas normalizadas em arrays prontos para montar o nível:
+      kinds     (ROWS, COLS) uint8   tipos KIND_*
+      masks     (ROWS, COLS) uint8   índice em SOLID_TEXTURE_KEYS
+      spawns    (2, 2) int16         midbottom de red/blue (-1 se faltar)
+      enemies   (N, 3) int16         tipo ENEMY_*, x, y (ordem de leitura)
+      colliders (N, 4) int16         retângulos sólidos mesclados
+    """
+    chars = _char_grid(lines)
+    kinds = _KIND_LUT[chars]
+
+    enemy_cells = np.argwhere(np.isin(chars, [ord(c) for c in _ENEMY_CHARS]))
+    enemies = [
+        (_ENEMY_CHARS[chr(chars[j, i])], i * TILE, j * TILE) for j, i in enemy_cells
+    ]
+
+    return {
+        "kinds": kinds,
+        "masks": autotile_masks(kinds),
+        "spawns": np.array([_spawn_point(chars, "1"), _spawn_point(chars, "2")], dtype=np.int16),
+        "enemies": np.array(enemies, dtype=np.int16).reshape(-1, 3),
+        "colliders": merge_solid_rects(kinds),
+    }
+
+# ----------------- Cache em disco -----------------
+def cache_path(level_path):
+    """levels/level1.txt -> levels/level1.cache.npz"""
+    root, _ = os.path.splitext(level_path)
+    return root + ".cache.npz"
+
+def _content_hash(raw):
+    h = hashlib.sha1(raw)
+    h.update(f"v{CACHE_VERSION} {COLS}x{ROWS} tile{TILE}".encode())
+    return np.frombuffer(h.digest(), dtype=np.uint8)
+
+def _read_cache(cpath, digest):
+    try:
+        with np.load(cpath, allow_pickle=False) as npz:
+            if not np.array_equal(npz["hash"], digest):
+                return None
+            return {key: npz[key] for key in ("kinds", "masks", "spawns", "enemies", "colliders")}
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+        # cache derivado nunca é fatal: ilegível/truncado -> recompila
+        return None
+
+def _write_cache(cpath, digest, data):
+    tmp = cpath + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, hash=digest, **data)
+        os.replace(tmp, cpath)
+    except OSError as e:
+        print(f"Aviso: não foi possível salvar cache do nível ({e})")
+
+def load_compiled_level(level_path, use_cache=True):
+    """
+    Devolve o nível compilado. Usa o cache binário ao lado do .txt se o hash
+    do conteúdo bater; senão compila e regrava o cache. Arquivo ausente vira
+    o nível de emergência (sem cache).
+    """
+    try:
+        with open(level_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo de nível não encontrado: {level_path}")
+        return compile_level(default_level_lines())
+
+    digest = _content_hash(raw)
+    cpath = cache_path(level_path)
+    if use_cache:
+        data = _read_cache(cpath, digest)
+        if data is not None:
+            return data
+
+    data = compile_level(normalize_lines(raw.decode("utf-8").splitlines()))
+    if use_cache:
+        _write_cache(cpath, digest, data)
+    return data
+
+
+# ----------------- Pacote de níveis (mmap) -----------------
+# Arquivo único com todos os níveis compilados, lido via mmap: os arrays
+# devolvidos são views do mapeamento (sem cópia nem abrir um arquivo por fase).
+#   cabeçalho: magic, versão, TILE, COLS, ROWS, quantidade
+#   índice:    por nível -> número, offsets de kinds/masks/spawns/enemies/colliders,
+#              quantidade de inimigos e de colisores
+#   dados:     arrays crus, alinhados em 8 bytes
+PACK_NAME = "levels.pack"
+_PACK_MAGIC = b"DWLP"
+_PACK_HEADER = struct.Struct("<4sIIIII")
+_PACK_ENTRY = struct.Struct("<I5QII")
+
+# (chave, dtype, colunas) na ordem em que ficam no pacote
+_PACK_ARRAYS = (
+    ("kinds", np.uint8, COLS),
+    ("masks", np.uint8, COLS),
+    ("spawns", np.int16, 2),
+    ("enemies", np.int16, 3),
+    ("colliders", np.int16, 4),
+)
+
+def level_file(levels_dir, number):
+    return os.path.join(levels_dir, f"level{number}.txt")
+
+def build_level_pack(levels_dir, numbers, pack_path=None):
+    """Compila os níveis `numbers` e grava o pacote (padrão: levels_dir/levels.pack)."""
+    pack_path = pack_path or os.path.join(levels_dir, PACK_NAME)
+    levels = [(n, load_compiled_level(level_file(levels_dir, n), use_cache=False)) for n in numbers]
+
+    offset = _PACK_HEADER.size + _PACK_ENTRY.size * len(levels)
+    index, blobs = [], []
+    for n, data in levels:
+        offsets = []
+        for key, dtype, cols in _PACK_ARRAYS:
+            blob = np.ascontiguousarray(data[key], dtype=dtype).reshape(-1, cols).tobytes()
+            blob += b"\0" * (-len(blob) % 8)
+            offsets.append(offset)
+            blobs.append(blob)
+            offset += len(blob)
+        index.append(_PACK_ENTRY.pack(n, *offsets, len(data["enemies"]), len(data["colliders"])))
+
+    tmp = pack_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_PACK_HEADER.pack(_PACK_MAGIC, CACHE_VERSION, TILE, COLS, ROWS, len(levels)))
+        f.write(b"".join(index))
+        f.write(b"".join(blobs))
+    os.replace(tmp, pack_path)
+    return pack_path
+
+class LevelPack:
+    """Pacote de níveis mapeado em memória; get(n) devolve views somente leitura."""
+    def __init__(self, pack_path):
+        with open(pack_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, tile, cols, rows, count = _PACK_HEADER.unpack_from(self._mm, 0)
+        if magic != _PACK_MAGIC or version != CACHE_VERSION:
+            self._mm.close()
+            raise ValueError(f"pacote de níveis inválido ou de outra versão: {pack_path}")
+        if (tile, cols, rows) != (TILE, COLS, ROWS):
+            # grade e spawns em pixels só valem para o TILE/COLS/ROWS do build
+            self._mm.close()
+            raise ValueError(f"pacote de níveis gerado para outro TILE/COLS/ROWS: {pack_path}")
+        self._index = {}
+        for k in range(count):
+            n, *offsets, n_enemies, n_colliders = _PACK_ENTRY.unpack_from(
+                self._mm, _PACK_HEADER.size + k * _PACK_ENTRY.size
+            )
+            rows = {"kinds": ROWS, "masks": ROWS, "spawns": 2, "enemies": n_enemies, "colliders": n_colliders}
+            arrays = [(key, dtype, rows[key], cols, off)
+                      for (key, dtype, cols), off in zip(_PACK_ARRAYS, offsets)]
+            # pacote truncado/corrompido: recusa aqui em vez de falhar no get
+            if any(off + r * c * np.dtype(dtype).itemsize > len(self._mm) for _, dtype, r, c, off in arrays):
+                self._mm.close()
+                raise ValueError(f"pacote de níveis truncado: {pack_path}")
+            self._index[n] = arrays
+
+    def __contains__(self, number):
+        return number in self._index
+
+    def get(self, number):
+        return {key: np.frombuffer(self._mm, dtype=dtype, count=r * c, offset=off).reshape(r, c)
+                for key, dtype, r, c, off in self._index[number]}
+
+def open_level_pack(levels_dir, numbers):
+    """
+    Abre levels_dir/levels.pack se existir e estiver em dia (nenhum .txt mais
+    novo que o pacote e todos os níveis presentes). Senão devolve None.
+    """
+    pack_path = os.path.join(levels_dir, PACK_NAME)
+    try:
+        pack_mtime = os.stat(pack_path).st_mtime_ns
+        for n in numbers:
+            if os.stat(level_file(levels_dir, n)).st_mtime_ns > pack_mtime:
+                return None
+        pack = LevelPack(pack_path)
+    except (OSError, ValueError, struct.error):
+        return None
+    if not all(n in pack for n in numbers):
+        return None
+    return pack
+
+
+if __name__ == "__main__":
+    # Gera o pacote a partir de levels/level1..6.txt (builds de quiosque)
+    levels_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "levels"))
+    print("Pacote gerado:", build_level_pack(levels_dir, range(1, 7)))
@@ -2,7 +2,7 @@ import pygame
 import math
 import random
 from settings import WIDTH, HEIGHT, FPS, BG
-from assets import load_player_sprites, load_image
+from assets import load_player_sprites, load_image_scaled, render_text
 
 class MenuButton:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -24,7 +24,7 @@ class MenuButton:
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 3, border_radius=10)
         
         # Texto
-        text_surf = font.render(self.text, True, (255, 255, 255))
+        text_surf = render_text(font, self.text, True, (255, 255, 255))
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
         
@@ -59,8 +59,7 @@ class Menu:
         self.clock = pygame.time.Clock()
         
         # Carrega imagem de fundo
-        self.background = load_image("Preview_2.jpg")
-        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+        self.background = load_image_scaled("Preview_2.jpg", (WIDTH, HEIGHT))
         
         # Carrega sprites dos dinossauros
         player_frames = load_player_sprites()
@@ -116,17 +115,17 @@ class Menu:
         title_text = "DinoWars"
         
         # Sombra
-        shadow = self.title_font.render(title_text, True, (0, 0, 0))
+        shadow = render_text(self.title_font, title_text, True, (0, 0, 0))
         shadow_rect = shadow.get_rect(center=(WIDTH // 2 + 5, 120 + 5))
         self.screen.blit(shadow, shadow_rect)
         
         # Título principal em amarelo claro
-        title = self.title_font.render(title_text, True, (255, 255, 150))
+        title = render_text(self.title_font, title_text, True, (255, 255, 150))
         title_rect = title.get_rect(center=(WIDTH // 2, 120))
         self.screen.blit(title, title_rect)
         
         # Subtítulo em preto
-        subtitle = self.subtitle_font.render("Chegue ao portal mágico!", True, (0, 0, 0))
+        subtitle = render_text(self.subtitle_font, "Chegue ao portal mágico!", True, (0, 0, 0))
         subtitle_rect = subtitle.get_rect(center=(WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
 
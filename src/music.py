@@ -0,0 +1,134 @@
+import queue
+import threading
+import numpy as np
+import pygame
+from assets import ambient_progression, mixer_rate, oscillator_bank, to_pcm
+
+class MusicStream:
+    """
+    Música ambiente gerada em streaming: uma thread sintetiza pedaços curtos
+    (chunk_seconds) da progressão do nível e os entrega ao canal com
+    Channel.queue, sempre um à frente do que está tocando. A fase de cada
+    voz é acumulada entre pedaços (sem cliques nas emendas) e a ordem dos
+    acordes/inversões é sorteada a cada compasso, então a faixa não se repete
+    e a memória usada fica em poucos pedaços, qualquer que seja a duração.
+    """
+    def __init__(self, channel, volume=0.15, chunk_seconds=0.5, bar_seconds=1.0):
+        self.channel = channel
+        self.volume = volume
+        self.chunk_seconds = chunk_seconds
+        self.bar_seconds = bar_seconds
+        self._lock = threading.Lock()  # play/stop x entrega ao canal
+        self._stop = None
+        # Uma thread só, criada no primeiro play e alimentada por esta fila:
+        # recomeçar a fase não cria nem espera thread nenhuma
+        self._requests = queue.Queue()
+        self._thread = None
+
+    def play(self, level_number):
+        """Começa (ou recomeça) a música do nível."""
+        self.stop()
+        stop = threading.Event()
+        with self._lock:
+            self._stop = stop
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name="music-stream", daemon=True)
+                self._thread.start()
+        self._requests.put((level_number, stop))
+
+    def stop(self, wait=False):
+        """
+        Para a música; a síntese em andamento vê o evento e volta para a fila.
+        wait=True também encerra a thread (no fim do jogo, antes de pygame.quit()).
+        """
+        with self._lock:
+            if self._stop is not None:
+                self._stop.set()
+                self._stop = None
+            self.channel.stop()
+            thread = self._thread if wait else None
+            if wait:
+                self._thread = None
+        if thread is not None:
+            self._requests.put(None)
+            thread.join()
+
+    def _worker(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            level_number, stop = request
+            if not stop.is_set():  # pedidos já substituídos por outro play são pulados
+                self._run(level_number, stop)
+
+    # ----------------- Síntese -----------------
+    def _run(self, level_number, stop):
+        rate = mixer_rate()
+        chunk_len = max(1, int(self.chunk_seconds * rate))
+        bar_len = max(1, int(self.bar_seconds * rate))
+        fade = min(bar_len // 2, int(0.1 * rate))
+        # Envelope de um compasso (entra/sai em 0.1 s, como o loop antigo)
+        envelope = np.ones(bar_len)
+        envelope[:fade] = np.linspace(0, 1, fade)
+        envelope[bar_len - fade:] = np.linspace(1, 0, fade)
+
+        progression = np.asarray(ambient_progression(level_number), dtype=np.float64)
+        rng = np.random.default_rng(level_number)
+        phases = None
+        bars = []        # acordes (freqs) dos compassos ainda não totalmente renderizados
+        position = 0     # amostra absoluta do início do próximo pedaço
+        chord_index = -1
+
+        while not stop.is_set():
+            # Sorteia compassos suficientes para cobrir o pedaço
+            first_bar = position // bar_len
+            last_bar = (position + chunk_len - 1) // bar_len
+            while first_bar + len(bars) <= last_bar:
+                # Normalmente segue a progressão; às vezes pula para outro acorde
+                if rng.random() < 0.7:
+                    chord_index = (chord_index + 1) % len(progression)
+                else:
+                    chord_index = int(rng.integers(len(progression)))
+                chord = progression[chord_index].copy()
+                if rng.random() < 0.3:  # inversão: fundamental uma oitava acima
+                    chord[0] *= 2
+                bars.append(chord)
+
+            samples = position + np.arange(chunk_len)
+            # Renderiza o pedaço por trecho de compasso (no máximo dois ou três);
+            # a fase de cada voz continua de um trecho/pedaço para o outro
+            parts = []
+            offset = 0
+            while offset < chunk_len:
+                bar = (position + offset) // bar_len
+                seg = min(chunk_len - offset, (bar + 1) * bar_len - (position + offset))
+                freqs = bars[bar - first_bar][:, None]
+                sines, phases = oscillator_bank(freqs, freqs, 1, seg, rate, phases)
+                parts.append(sines.sum(axis=0))
+                offset += seg
+            wave = np.concatenate(parts) / progression.shape[1]
+            wave *= envelope[samples % bar_len] * 0.15
+            position += chunk_len
+            bars = bars[(position // bar_len) - first_bar:]
+
+            sound = pygame.sndarray.make_sound(to_pcm(wave))
+            sound.set_volume(self.volume)
+            if not self._feed(sound, stop):
+                return
+
+    def _feed(self, sound, stop):
+        """Espera o canal aceitar mais um pedaço na fila; False se foi parado."""
+        poll = self.chunk_seconds / 4
+        while True:
+            with self._lock:
+                if stop.is_set():
+                    return False
+                if not self.channel.get_busy():
+                    self.channel.play(sound)  # início (ou a fila esvaziou)
+                    return True
+                if self.channel.get_queue() is None:
+                    self.channel.queue(sound)
+                    return True
+            if stop.wait(poll):
+                return False
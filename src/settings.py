@@ -9,6 +9,40 @@ TILE = 24                      # era 48
 COLS = WIDTH // TILE           # 960/24 = 40
 ROWS = HEIGHT // TILE          # 576/24 = 24
 
+# Orçamento de memória do registro de assets (surfaces prontas), em bytes.
+# Acima disso os itens usados há mais tempo são descartados (LRU).
+ASSET_MEMORY_BUDGET = 48 * 1024 * 1024
+
+# Cache de textos renderizados (HUD, menus, telas), em bytes, também LRU.
+TEXT_CACHE_BUDGET = 4 * 1024 * 1024
+
+# Quantos fundos de fase (WIDTH x HEIGHT, opacos) ficam em memória:
+# o da fase atual e o da próxima, pré-carregado.
+BACKGROUND_CACHE_SIZE = 2
+
+# Áudio: canal 0 é só da música; os efeitos usam um pool fixo de canais
+# (1..SFX_CHANNELS) gerenciado pelo VoiceManager (sfx.py).
+MUSIC_CHANNEL = 0
+SFX_CHANNELS = 6
+# efeito -> (prioridade, instâncias simultâneas, intervalo mínimo em s por fonte)
+SFX_RULES = {
+    'victory': (4, 1, 0.5),
+    'defeat':  (4, 1, 0.5),
+    'death':   (3, 2, 0.10),
+    'collect': (2, 2, 0.05),
+    'jump':    (2, 2, 0.05),
+    'land':    (1, 2, 0.08),
+}
+DEFAULT_SFX_RULE = (1, 1, 0.05)
+
+# Renderização por retângulos sujos: a cada frame só as áreas por onde
+# passaram sprites/HUD são restauradas e enviadas com display.update(rects),
+# em vez de redesenhar e dar flip na tela inteira. Útil em render por software.
+DIRTY_RECTS = False
+
+# Títulos pulsantes (vitória, pausa): quantas escalas são pré-calculadas
+TITLE_PULSE_STEPS = 16
+
 # Física / movimento
 GRAVITY = 0.8
 MOVE_SPEED = 5
@@ -18,6 +52,24 @@ JUMP_SPEED = 16
 PLAYER_H = 48                  # 2x o TILE
 PLAYER_W = 48
 
+# Camadas de colisão (bitmask): cada player trata "neutro + sua cor" como
+# sólido e "a outra cor" como letal, numa única consulta ao índice.
+COLLISION_NEUTRAL = 1
+COLLISION_RED     = 2
+COLLISION_BLUE    = 4
+COLLISION_COLORS  = {"red": COLLISION_RED, "blue": COLLISION_BLUE}
+
+# Tipos de tile na grade uint8 do nível (levelmap.compile_level)
+KIND_EMPTY      = 0
+KIND_SOLID      = 1
+KIND_RED        = 2
+KIND_BLUE       = 3
+KIND_SPIKE      = 4
+KIND_RAMP_UP    = 5
+KIND_RAMP_DOWN  = 6
+KIND_GOAL_RED   = 7
+KIND_GOAL_BLUE  = 8
+
 # Cores
 WHITE   = (240, 240, 240)
 BLACK   = (15, 15, 20)
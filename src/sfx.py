@@ -0,0 +1,60 @@
+import pygame
+from settings import MUSIC_CHANNEL, SFX_CHANNELS, SFX_RULES, DEFAULT_SFX_RULE
+
+class VoiceManager:
+    """
+    Toca efeitos sonoros num pool fixo de canais (nunca o da música).
+    Cada efeito tem prioridade, limite de instâncias simultâneas e intervalo
+    mínimo entre disparos da mesma fonte (SFX_RULES). Pool cheio: a voz mais antiga de
+    prioridade menor ou igual é interrompida; se não houver, o som é
+    descartado. Assim o custo de mixagem fica limitado a SFX_CHANNELS vozes.
+    """
+    def __init__(self, sounds, n_channels=SFX_CHANNELS):
+        self.sounds = sounds
+        first = MUSIC_CHANNEL + 1
+        pygame.mixer.set_num_channels(first + n_channels)
+        # reservados: Sound.play() solto não pode escolher nenhum deles
+        pygame.mixer.set_reserved(first + n_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(first, first + n_channels)]
+        self._voices = {}     # canal -> (nome, prioridade, ticks do início)
+        self._last_play = {}  # (nome, fonte) -> ticks do último disparo
+
+    def _active(self):
+        """Vozes ainda tocando (limpa as que terminaram)."""
+        for ch in [ch for ch in self._voices if not ch.get_busy()]:
+            del self._voices[ch]
+        return self._voices
+
+    def play(self, name, source=None):
+        """
+        Toca o efeito `name` respeitando as regras; devolve o canal ou None.
+        O intervalo mínimo vale por fonte (ex.: a cor de cada jogador), então dois
+        dinos pulando juntos tocam as duas instâncias.
+        """
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+        priority, max_instances, cooldown = SFX_RULES.get(name, DEFAULT_SFX_RULE)
+        now = pygame.time.get_ticks()
+        last = self._last_play.get((name, source))
+        if last is not None and now - last < cooldown * 1000:
+            return None
+
+        voices = self._active()
+        same = [ch for ch, (n, _, _) in voices.items() if n == name]
+        if len(same) >= max_instances:
+            # Redispara: reaproveita a instância mais antiga do mesmo efeito
+            channel = min(same, key=lambda ch: voices[ch][2])
+        else:
+            channel = next((ch for ch in self.channels if ch not in voices), None)
+            if channel is None:
+                # Pool cheio: rouba a voz mais antiga de prioridade <= a nova
+                victims = [ch for ch, (_, p, _) in voices.items() if p <= priority]
+                if not victims:
+                    return None
+                channel = min(victims, key=lambda ch: (voices[ch][1], voices[ch][2]))
+
+        channel.play(sound)
+        voices[channel] = (name, priority, now)
+        self._last_play[(name, source)] = now
+        return channel
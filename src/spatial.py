@@ -0,0 +1,116 @@
+import pygame
+import numpy as np
+from settings import TILE, ROWS, COLS, WIDTH, PLAYER_W
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    Grupo de sprites ESTÁTICOS com índice em grade uniforme (células de TILE).
+    Cada sprite é registrado em todas as células que seu rect cobre; as
+    consultas só olham as poucas células sob o rect pedido, então o custo
+    não cresce com o número de tiles do mapa.
+    """
+    def __init__(self, *sprites):
+        self.cells = {}
+        super().__init__(*sprites)
+
+    @staticmethod
+    def _cell_range(rect):
+        x0 = rect.left // TILE
+        x1 = (rect.right - 1) // TILE
+        y0 = rect.top // TILE
+        y1 = (rect.bottom - 1) // TILE
+        return x0, x1, y0, y1
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        x0, x1, y0, y1 = self._cell_range(sprite.rect)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.cells.setdefault((cx, cy), []).append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        x0, x1, y0, y1 = self._cell_range(sprite.rect)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket and sprite in bucket:
+                    bucket.remove(sprite)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def collide(self, rect, mask=None):
+        """
+        Equivalente a spritecollide, mas só testa as células sob o rect.
+        mask: se informado, só devolve sprites com (sprite.collision_layer & mask) != 0.
+        """
+        x0, x1, y0, y1 = self._cell_range(rect)
+        hits = []
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                for s in self.cells.get((cx, cy), ()):
+                    if mask is not None and not (s.collision_layer & mask):
+                        continue
+                    if s not in hits and s.rect.colliderect(rect):
+                        hits.append(s)
+        return hits
+
+
+# ----------------- Grade de tipos (uint8) -----------------
+def cells_under(kinds, rect):
+    """View da grade de tipos com as células sob o rect (recortada ao mapa)."""
+    x0 = max(0, rect.left // TILE)
+    x1 = min(COLS, (rect.right - 1) // TILE + 1)
+    y0 = max(0, rect.top // TILE)
+    y1 = min(ROWS, (rect.bottom - 1) // TILE + 1)
+    return kinds[y0:y1, x0:x1]
+
+
+# Alcance da busca de rampas em torno do centerx do player. Reproduz a janela
+# antiga: retângulo dos pés (largura PLAYER_W//2) inflado de TILE.
+_RAMP_REACH_LEFT  = PLAYER_W // 4 + TILE // 2
+_RAMP_REACH_RIGHT = PLAYER_W // 2 - PLAYER_W // 4 + TILE // 2
+_NO_RAMP = np.iinfo(np.int16).max
+
+
+class RampGroup(pygame.sprite.Group):
+    """
+    Grupo de rampas com tabela de alturas pré-calculada.
+    heights[linha, x] = menor Y de superfície entre as rampas daquela linha
+    de tiles ao alcance de um player com centerx == x (_NO_RAMP se nenhuma).
+    O encaixe na rampa vira uma consulta O(1) por linha.
+    """
+    def __init__(self, *sprites):
+        self.heights = np.full((ROWS, WIDTH), _NO_RAMP, dtype=np.int16)
+        super().__init__(*sprites)
+
+    def _stamp(self, ramp):
+        row = ramp.rect.top // TILE
+        x0 = max(0, ramp.rect.left - _RAMP_REACH_RIGHT + 1)
+        x1 = min(WIDTH, ramp.rect.right + _RAMP_REACH_LEFT)
+        if x0 >= x1:
+            return
+        xs = np.arange(x0, x1)
+        lx = np.clip(xs - ramp.rect.left, 0, TILE - 1)
+        if ramp.slope == "up":
+            ys = ramp.rect.top + (TILE - 1 - lx)
+        else:
+            ys = ramp.rect.top + lx
+        np.minimum(self.heights[row, x0:x1], ys, out=self.heights[row, x0:x1])
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._stamp(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.heights.fill(_NO_RAMP)
+        for r in self.sprites():
+            self._stamp(r)
+
+    def surface_at(self, row, world_x):
+        """Y da superfície na linha de tiles `row` para um player em world_x (ou None)."""
+        if not 0 <= row < ROWS:
+            return None
+        y = int(self.heights[row, max(0, min(WIDTH - 1, world_x))])
+        return None if y == _NO_RAMP else y
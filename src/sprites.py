@@ -1,8 +1,11 @@
 import pygame
 from settings import (
     TILE, NEUTRAL, RED, BLUE, HAZARD, GOAL_R, GOAL_B,
-    MOVE_SPEED, JUMP_SPEED, GRAVITY, WIDTH, HEIGHT
+    MOVE_SPEED, JUMP_SPEED, GRAVITY, WIDTH, HEIGHT,
+    COLLISION_NEUTRAL, COLLISION_COLORS, KIND_SPIKE
 )
+from spatial import cells_under
+from assets import flip_frames
 
 class Tile(pygame.sprite.Sprite):
     """
@@ -17,6 +20,7 @@ class Tile(pygame.sprite.Sprite):
         self.color_kind = color_kind
         self.goal_for = goal_for
         self.slope = slope  # None | "up" | "down"
+        self.collision_layer = COLLISION_COLORS.get(color_kind, COLLISION_NEUTRAL)
 
         if image is None:
             # fallback visual simples quando não vem textura
@@ -55,6 +59,22 @@ class Tile(pygame.sprite.Sprite):
         return self.surface_y(world_x - self.rect.left)
 
 
+class Collider(pygame.sprite.Sprite):
+    """
+    Retângulo sólido só para física (sem imagem): cobre vários tiles '#'
+    mesclados. As texturas continuam nos Tile individuais.
+    """
+    def __init__(self, rect):
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.solid = True
+        self.deadly = False
+        self.color_kind = None
+        self.goal_for = None
+        self.slope = None
+        self.collision_layer = COLLISION_NEUTRAL
+
+
 class AnimatedTile(pygame.sprite.Sprite):
     """
     Tile com animação (para portais, etc)
@@ -114,6 +134,12 @@ class PatrolEnemy(pygame.sprite.Sprite):
         
         self.rect.x = int(self.pos.x)
 
+    def reset(self):
+        """Volta ao estado inicial (reinício instantâneo da fase)"""
+        self.pos.x = self.start_x
+        self.direction = 1
+        self.rect.x = int(self.pos.x)
+
 
 class FallingEnemy(pygame.sprite.Sprite):
     """
@@ -122,7 +148,10 @@ class FallingEnemy(pygame.sprite.Sprite):
     def __init__(self, x, y, image, fall_delay=2.0):
         super().__init__()
         self.original_image = image
-        self.image = image.copy()
+        # Cópia apagada só para o aviso; fora dele desenha a própria imagem (atlas)
+        self.dim_image = image.copy()
+        self.dim_image.set_alpha(80)
+        self.image = image
         self.start_y = y
         self.rect = self.image.get_rect(topleft=(x, y))
         
@@ -156,11 +185,7 @@ class FallingEnemy(pygame.sprite.Sprite):
                 self.visible = not self.visible
                 self.blink_timer = 0
                 # Altera alpha para piscar
-                if self.visible:
-                    self.image = self.original_image.copy()
-                else:
-                    self.image = self.original_image.copy()
-                    self.image.set_alpha(80)
+                self.image = self.original_image if self.visible else self.dim_image
             
             # Terminar aviso e começar queda
             if self.timer >= self.warning_time:
@@ -168,7 +193,7 @@ class FallingEnemy(pygame.sprite.Sprite):
                 self.is_falling = True
                 self.fall_speed = 0
                 self.timer = 0
-                self.image = self.original_image.copy()
+                self.image = self.original_image
         
         elif self.is_falling:
             # Cai com aceleração
@@ -184,6 +209,18 @@ class FallingEnemy(pygame.sprite.Sprite):
                 self.fall_speed = 0
                 self.timer = 0
 
+    def reset(self):
+        """Volta ao estado inicial (reinício instantâneo da fase)"""
+        self.image = self.original_image
+        self.pos.y = self.start_y
+        self.rect.y = int(self.pos.y)
+        self.fall_speed = 0
+        self.is_falling = False
+        self.is_warning = False
+        self.timer = 0
+        self.blink_timer = 0
+        self.visible = True
+
 
 class VerticalPatrolEnemy(pygame.sprite.Sprite):
     """
@@ -215,17 +252,30 @@ class VerticalPatrolEnemy(pygame.sprite.Sprite):
         
         self.rect.y = int(self.pos.y)
 
+    def reset(self):
+        """Volta ao estado inicial (reinício instantâneo da fase)"""
+        self.pos.y = self.start_y
+        self.direction = 1
+        self.rect.y = int(self.pos.y)
+
 
 # ------------------- PLAYER -------------------
 class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y, color_name, frames, sounds=None):
+    def __init__(self, x, y, color_name, frames, sounds=None, frames_left=None):
         super().__init__()
         self.color_name = color_name  # "red" | "blue"
-        self.sounds = sounds or {}
+        self.sounds = sounds  # VoiceManager (sfx.py) ou None
+
+        # camadas: neutro + própria cor = sólido; cor do outro dino = letal
+        self.solid_mask = COLLISION_NEUTRAL | COLLISION_COLORS[color_name]
+        self.lethal_mask = 0
+        for name, layer in COLLISION_COLORS.items():
+            if name != color_name:
+                self.lethal_mask |= layer
 
         # animação
         self.frames_right = frames[:]
-        self.frames_left  = [pygame.transform.flip(f, True, False) for f in frames]
+        self.frames_left  = frames_left if frames_left is not None else flip_frames(frames)
         self.anim_index = 0.0
         self.anim_speed = 12.0
         self.facing = 1
@@ -254,8 +304,11 @@ class Player(pygame.sprite.Sprite):
             self.vel.y = -JUMP_SPEED
             self.on_ground = False
             # Som de pulo
-            if 'jump' in self.sounds:
-                self.sounds['jump'].play()
+            self.play_sound('jump')
+
+    def play_sound(self, name):
+        if self.sounds is not None:
+            self.sounds.play(name, source=self.color_name)
 
     def apply_gravity(self):
         self.vel.y += GRAVITY
@@ -263,7 +316,12 @@ class Player(pygame.sprite.Sprite):
             self.vel.y = 24
 
     def collide_axis(self, solids, axis):
-        hits = pygame.sprite.spritecollide(self, solids, False)
+        # Uma consulta só: sólidos para este dino e tiles da cor errada (letais)
+        hits = solids.collide(self.rect, self.solid_mask | self.lethal_mask)
+        for t in hits:
+            if t.collision_layer & self.lethal_mask:
+                self._respawn()
+                return
         for t in hits:
             if axis == "x":
                 if self.vel.x > 0:
@@ -276,8 +334,8 @@ class Player(pygame.sprite.Sprite):
                     self.rect.bottom = t.rect.top
                     self.vel.y = 0
                     # Som de pousar (só se estava no ar)
-                    if not self.on_ground and not self.was_on_ground and 'land' in self.sounds:
-                        self.sounds['land'].play()
+                    if not self.on_ground and not self.was_on_ground:
+                        self.play_sound('land')
                     self.on_ground = True
                 elif self.vel.y < 0:
                     self.rect.top = t.rect.bottom
@@ -286,8 +344,7 @@ class Player(pygame.sprite.Sprite):
 
     def _respawn(self):
         # Som de morte
-        if 'death' in self.sounds:
-            self.sounds['death'].play()
+        self.play_sound('death')
         self.rect.midbottom = self.spawn
         self.pos.update(self.rect.x, self.rect.y)
         self.vel.update(0, 0)
@@ -295,29 +352,18 @@ class Player(pygame.sprite.Sprite):
         self.was_on_ground = False
         self.in_goal = False
 
-    def check_underfoot(self, color_tiles, hazards):
-        # piso imediatamente sob os pés
+    def check_underfoot(self, kinds):
+        # piso imediatamente sob os pés (tiles de cor errada já são tratados em collide_axis)
         self.rect.y += 1
-        hits_color = pygame.sprite.spritecollide(self, color_tiles, False)
-        hits_haz   = pygame.sprite.spritecollide(self, hazards, False)
+        on_spike = (cells_under(kinds, self.rect) == KIND_SPIKE).any()
         self.rect.y -= 1
 
-        if hits_haz:
+        if on_spike:
             self._respawn()
-            return
-
-        for t in hits_color:
-            wrong = (
-                (self.color_name == "red" and t.color_kind == "blue") or
-                (self.color_name == "blue" and t.color_kind == "red")
-            )
-            if wrong:
-                self._respawn()
-                return
 
     def check_goal(self, doors):
         self.in_goal = False
-        for d in pygame.sprite.spritecollide(self, doors, False):
+        for d in doors.collide(self.rect):
             if d.goal_for == self.color_name:
                 self.in_goal = True
                 break
@@ -332,39 +378,30 @@ class Player(pygame.sprite.Sprite):
     def collide_slopes(self, ramps):
         """
         Regras:
-        - Considera rampas onde o player está em cima (overlap X e Y próximo).
-        - Calcula Y da superfície na coluna do pé (centerx).
+        - Considera as linhas de tiles próximas dos pés (acima primeiro).
+        - Consulta a tabela de alturas das rampas na coluna do pé (centerx).
         - Se o pé atravessou a superfície, encaixa no Y e zera vel.y.
         """
-        # Retângulo pequeno nos pés para limitar busca
-        feet_rect = pygame.Rect(self.rect.centerx - self.rect.width // 4,
-                                self.rect.bottom - 2,  # 2px acima da sola
-                                self.rect.width // 2, 4)
-
-        candidates = [r for r in ramps if r.rect.colliderect(feet_rect.inflate(TILE, TILE))]
-        if not candidates:
-            return
-
-        # Ordena por Y do topo (a rampa mais alta primeiro) para evitar encaixe no tile errado
-        candidates.sort(key=lambda r: r.rect.top)
+        # Linhas cujo tile encosta na faixa dos pés (rect.bottom +- TILE//2 + 2)
+        first_row = (self.rect.bottom - 2 - TILE // 2 - TILE) // TILE + 1
+        last_row = (self.rect.bottom + 2 + TILE // 2 - 1) // TILE
 
-        for r in candidates:
+        for row in range(first_row, last_row + 1):
+            top = row * TILE
             # Só considera se verticalmente estamos dentro do tile
-            if self.rect.bottom < r.rect.top - 1 or self.rect.top > r.rect.bottom:
+            if self.rect.bottom < top - 1 or self.rect.top > top + TILE:
                 continue
 
-            y_surface = r.y_at_world_x(self.rect.centerx)
+            y_surface = ramps.surface_at(row, self.rect.centerx)
             if y_surface is None:
                 continue
 
             # Se atravessou a superfície (pé abaixo da linha), encosta na superfície
-            if self.rect.bottom > y_surface >= r.rect.top:
-                self.rect.bottom = int(y_surface)
+            if self.rect.bottom > y_surface >= top:
+                self.rect.bottom = y_surface
                 self.pos.y = self.rect.y
                 self.vel.y = 0
                 self.on_ground = True
-                # Não damos break: pode haver duas rampas alinhadas; mas na prática 1 basta.
-                # break
 
     def animate(self, dt):
         moving = abs(self.vel.x) > 0.01
@@ -375,7 +412,7 @@ class Player(pygame.sprite.Sprite):
             self.anim_index = 0.0
         self.image = frames[int(self.anim_index)]
 
-    def update(self, keys, solids, color_tiles, hazards, doors, ramps, controls, dt):
+    def update(self, keys, solids, kinds, doors, ramps, controls, dt):
         left, right, jump = controls
         self.was_on_ground = self.on_ground
         self.handle_input(keys, left, right, jump)
@@ -396,7 +433,7 @@ class Player(pygame.sprite.Sprite):
         self.collide_slopes(ramps)
 
         # Regras
-        self.check_underfoot(color_tiles, hazards)
+        self.check_underfoot(kinds)
         self.check_goal(doors)
         self.clamp_and_fall()
         self.animate(dt)
\ No newline at end of file
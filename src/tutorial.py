@@ -1,7 +1,7 @@
 import pygame
 import math
 from settings import WIDTH, HEIGHT, FPS, TILE, RED, BLUE
-from assets import load_player_sprites, load_tile_textures, load_image
+from assets import load_player_sprites, load_tile_textures, load_image, render_text
 
 class TutorialScreen:
     def __init__(self):
@@ -25,6 +25,8 @@ class TutorialScreen:
         self.accent_color = (100, 200, 255)
         self.text_color = (240, 240, 245)
         self.dim_text = (160, 165, 175)
+        # Cópia própria (o set_alpha do pulsar não pode mexer na surface do cache)
+        self.start_text = render_text(self.text_font, "ENTER para comecar!", True, self.accent_color).copy()
         
         self.running = True
         
@@ -59,7 +61,7 @@ class TutorialScreen:
         pygame.draw.rect(key_surf, (120, 130, 150), (0, 0, size, size), 2, border_radius=8)
         pygame.draw.rect(key_surf, (80, 85, 100), (0, 0, size, size-10), border_radius=8)
         
-        key_text = self.text_font.render(text, True, (255, 255, 255))
+        key_text = render_text(self.text_font, text, True, (255, 255, 255))
         key_rect = key_text.get_rect(center=(size//2, size//2))
         key_surf.blit(key_text, key_rect)
         
@@ -86,14 +88,14 @@ class TutorialScreen:
             pygame.draw.rect(self.screen, (100, 100, 100), (x, y, TILE * 2, TILE * 2))
         
         if label:
-            text = self.small_font.render(label, True, self.text_color)
+            text = render_text(self.small_font, label, True, self.text_color)
             text_rect = text.get_rect(center=(x + TILE, y + TILE * 2 + 20))
             self.screen.blit(text, text_rect)
     
     def draw_page_0_welcome(self):
         # Titulo com efeito de brilho
-        title = self.title_font.render("DinoWars", True, (255, 255, 150))
-        title_glow = self.title_font.render("DinoWars", True, (255, 200, 100, 100))
+        title = render_text(self.title_font, "DinoWars", True, (255, 255, 150))
+        title_glow = render_text(self.title_font, "DinoWars", True, (255, 200, 100, 100))
         
         glow_offset = math.sin(self.anim_time * 2) * 3
         title_rect = title.get_rect(center=(WIDTH // 2, 80))
@@ -129,7 +131,7 @@ class TutorialScreen:
             color = self.text_color if line != story_lines[0] else self.accent_color
             font = self.heading_font if line == story_lines[0] else self.text_font
             
-            text = font.render(line, True, color)
+            text = render_text(font, line, True, color)
             text_rect = text.get_rect(center=(WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 30
@@ -138,7 +140,7 @@ class TutorialScreen:
         self.draw_animated_dino(WIDTH * 3 // 4, HEIGHT - 80, "blue", 2.5)
         
     def draw_page_1_controls(self):
-        title = self.heading_font.render("Controles", True, self.accent_color)
+        title = render_text(self.heading_font, "Controles", True, self.accent_color)
         title_rect = title.get_rect(center=(WIDTH // 2, 60))
         self.screen.blit(title, title_rect)
         
@@ -147,7 +149,7 @@ class TutorialScreen:
         p1_w, p1_h = 400, 340
         self.draw_panel(p1_x, p1_y, p1_w, p1_h)
         
-        p1_title = self.text_font.render("Jogador 1 (Vermelho)", True, (255, 100, 100))
+        p1_title = render_text(self.text_font, "Jogador 1 (Vermelho)", True, (255, 100, 100))
         p1_title_rect = p1_title.get_rect(center=(p1_x + p1_w//2, p1_y + 25))
         self.screen.blit(p1_title, p1_title_rect)
         
@@ -160,11 +162,11 @@ class TutorialScreen:
         self.draw_key(key_start + key_spacing, key_y, "D", 55)
         self.draw_key(key_start + key_spacing*2, key_y, "W", 55)
         
-        move_text = self.small_font.render("Mover", True, self.dim_text)
+        move_text = render_text(self.small_font, "Mover", True, self.dim_text)
         move_rect = move_text.get_rect(center=(key_start + key_spacing//2, key_y + 75))
         self.screen.blit(move_text, move_rect)
         
-        jump_text = self.small_font.render("Pular", True, self.dim_text)
+        jump_text = render_text(self.small_font, "Pular", True, self.dim_text)
         jump_rect = jump_text.get_rect(center=(key_start + key_spacing*2, key_y + 75))
         self.screen.blit(jump_text, jump_rect)
         
@@ -174,7 +176,7 @@ class TutorialScreen:
         p2_w, p2_h = p1_w, p1_h
         self.draw_panel(p2_x, p2_y, p2_w, p2_h)
         
-        p2_title = self.text_font.render("Jogador 2 (Azul)", True, (100, 150, 255))
+        p2_title = render_text(self.text_font, "Jogador 2 (Azul)", True, (100, 150, 255))
         p2_title_rect = p2_title.get_rect(center=(p2_x + p2_w//2, p2_y + 25))
         self.screen.blit(p2_title, p2_title_rect)
         
@@ -186,16 +188,16 @@ class TutorialScreen:
         self.draw_key(key_start + key_spacing, key_y, ">", 55)
         self.draw_key(key_start + key_spacing*2, key_y, "^", 55)
         
-        move_text = self.small_font.render("Mover", True, self.dim_text)
+        move_text = render_text(self.small_font, "Mover", True, self.dim_text)
         move_rect = move_text.get_rect(center=(key_start + key_spacing//2, key_y + 75))
         self.screen.blit(move_text, move_rect)
         
-        jump_text = self.small_font.render("Pular", True, self.dim_text)
+        jump_text = render_text(self.small_font, "Pular", True, self.dim_text)
         jump_rect = jump_text.get_rect(center=(key_start + key_spacing*2, key_y + 75))
         self.screen.blit(jump_text, jump_rect)
         
     def draw_page_2_mechanics(self):
-        title = self.heading_font.render("Mecanicas do Jogo", True, self.accent_color)
+        title = render_text(self.heading_font, "Mecanicas do Jogo", True, self.accent_color)
         title_rect = title.get_rect(center=(WIDTH // 2, 60))
         self.screen.blit(title, title_rect)
         
@@ -203,7 +205,7 @@ class TutorialScreen:
         panel_w = 800
         self.draw_panel(80, panel_y, panel_w, 160)
         
-        tiles_title = self.text_font.render("Tipos de Plataformas:", True, self.text_color)
+        tiles_title = render_text(self.text_font, "Tipos de Plataformas:", True, self.text_color)
         self.screen.blit(tiles_title, (110, panel_y + 15))
         
         tile_x = 140
@@ -227,15 +229,15 @@ class TutorialScreen:
         y_offset = rules_y + 30
         for icon, rule_text in rules:
             icon_color = self.icon_color_for(icon, rule_text)
-            icon_surf = self.text_font.render(icon, True, icon_color)
+            icon_surf = render_text(self.text_font, icon, True, icon_color)
             self.screen.blit(icon_surf, (110, y_offset))
             
-            text = self.text_font.render(rule_text, True, self.text_color)
+            text = render_text(self.text_font, rule_text, True, self.text_color)
             self.screen.blit(text, (150, y_offset))
             y_offset += 48
             
     def draw_page_3_tips(self):
-        title = self.heading_font.render("Dicas & Truques", True, self.accent_color)
+        title = render_text(self.heading_font, "Dicas & Truques", True, self.accent_color)
         title_rect = title.get_rect(center=(WIDTH // 2, 60))
         self.screen.blit(title, title_rect)
         
@@ -252,13 +254,13 @@ class TutorialScreen:
         y_offset = panel_y + 40
         for icon, tip_title, tip_text in tips:
             icon_color = self.icon_color_for(icon, tip_title + " " + tip_text)
-            icon_text = self.heading_font.render(icon, True, icon_color)
+            icon_text = render_text(self.heading_font, icon, True, icon_color)
             self.screen.blit(icon_text, (panel_x + 30, y_offset - 5))
             
-            title_text = self.text_font.render(tip_title, True, self.accent_color)
+            title_text = render_text(self.text_font, tip_title, True, self.accent_color)
             self.screen.blit(title_text, (panel_x + 90, y_offset))
             
-            desc_text = self.small_font.render(tip_text, True, self.dim_text)
+            desc_text = render_text(self.small_font, tip_text, True, self.dim_text)
             self.screen.blit(desc_text, (panel_x + 90, y_offset + 32))
             
             y_offset += 70
@@ -277,21 +279,21 @@ class TutorialScreen:
         nav_y = HEIGHT - 60
         
         if self.page > 0:
-            left_text = self.small_font.render("< Anterior (A)", True, self.dim_text)
+            left_text = render_text(self.small_font, "< Anterior (A)", True, self.dim_text)
             self.screen.blit(left_text, (30, nav_y))
         
         if self.page < self.max_pages - 1:
-            right_text = self.small_font.render("Proximo (D) >", True, self.dim_text)
+            right_text = render_text(self.small_font, "Proximo (D) >", True, self.dim_text)
             right_rect = right_text.get_rect(right=WIDTH - 30, top=nav_y)
             self.screen.blit(right_text, right_rect)
         else:
-            start_text = self.text_font.render("ENTER para comecar!", True, self.accent_color)
+            start_text = self.start_text
             start_rect = start_text.get_rect(center=(WIDTH // 2, nav_y + 5))
             alpha = int(200 + 55 * math.sin(self.anim_time * 4))
             start_text.set_alpha(alpha)
             self.screen.blit(start_text, start_rect)
         
-        skip_text = self.small_font.render("ESC - Pular Tutorial", True, self.dim_text)
+        skip_text = render_text(self.small_font, "ESC - Pular Tutorial", True, self.dim_text)
         skip_rect = skip_text.get_rect(center=(WIDTH // 2, 25))
         self.screen.blit(skip_text, skip_rect)
         